@@ -1,14 +1,147 @@
 import re
+import zlib
+import random
 import string
+import threading
+from bisect import bisect_right
 from difflib import SequenceMatcher
-from typing import List, Dict, Tuple, Set
-from collections import Counter
+from typing import List, Dict, Tuple, Set, Iterable, Iterator, Optional
+from collections import Counter, OrderedDict
+from results import SentenceResult
 from config import *
 
+_numpy = None
+
+def _load_numpy():
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+_SENTENCE_BOUNDARY = re.compile(r'(?P<stop>[.!?]+\s+)(?=[A-Z])|;\s+(?=[A-Z])')
+_WORD_PATTERN = re.compile(r'\b[a-zA-Z]+\b')
+_WHITESPACE = re.compile(r'\s+')
+_WHITESPACE_RUN = re.compile(r'\s{2,}')
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+_DISALLOWED_CHARS = re.compile(r'[^\w\s\.\!\?\;\:\,\-\'\"]')
+
+def clean_text(text: str) -> str:
+    text = _WHITESPACE.sub(' ', text)
+    text = _DISALLOWED_CHARS.sub(' ', text)
+    return text.strip()
+
+class OffsetMap:
+    def __init__(self, text: str):
+        self.clean_starts = [0]
+        self.original_starts = [0]
+        removed = 0
+        
+        for run in _WHITESPACE_RUN.finditer(text):
+            removed += run.end() - run.start() - 1
+            self.clean_starts.append(run.end() - removed)
+            self.original_starts.append(run.end())
+        
+        collapsed = _DISALLOWED_CHARS.sub(' ', _WHITESPACE.sub(' ', text))
+        self.leading = len(collapsed) - len(collapsed.lstrip())
+        self.cleaned = collapsed.strip()
+    
+    def to_original(self, index: int) -> int:
+        index += self.leading
+        segment = bisect_right(self.clean_starts, index) - 1
+        return self.original_starts[segment] + index - self.clean_starts[segment]
+    
+    def span(self, start: int, end: int) -> Tuple[int, int]:
+        return self.to_original(start), self.to_original(end - 1) + 1
+
+class TextFeatures:
+    __slots__ = ('normalized', 'tokens', 'words', 'word_set', 'counter', 'length', 'token_count', 'norm')
+    
+    def __init__(self, normalized: str, words: List[str]):
+        self.normalized = normalized
+        self.tokens = normalized.split()
+        self.words = words
+        self.word_set = set(words)
+        self.counter = Counter(self.tokens)
+        self.length = len(normalized)
+        self.token_count = len(self.tokens)
+        self.norm = sum(count * count for count in self.counter.values()) ** 0.5
+
+class MinHashLSH:
+    def __init__(self, bands: int = LSH_BANDS, rows: int = LSH_ROWS,
+                 shingle_size: int = LSH_SHINGLE_SIZE, seed: int = LSH_SEED,
+                 cache_size: int = LSH_CACHE_SIZE):
+        self.bands = bands
+        self.rows = rows
+        self.shingle_size = shingle_size
+        self.cache_size = cache_size
+        
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(bands * rows)
+        ]
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        
+    def signature(self, tokens: List[str]) -> Tuple[int, ...]:
+        size = self.shingle_size
+        shingles = {
+            zlib.crc32(' '.join(tokens[i:i + size]).encode('utf-8'))
+            for i in range(max(1, len(tokens) - size + 1))
+        } if tokens else set()
+        
+        if not shingles:
+            return ()
+        
+        return tuple(
+            min((a * shingle + b) % _MERSENNE_PRIME for shingle in shingles)
+            for a, b in self._permutations
+        )
+    
+    def band_keys(self, signature: Tuple[int, ...]) -> Set[Tuple[int, ...]]:
+        if not signature:
+            return set()
+        
+        rows = self.rows
+        return {(band,) + signature[band * rows:(band + 1) * rows] for band in range(self.bands)}
+    
+    def cached_band_keys(self, key: str, tokens: List[str]) -> Set[Tuple[int, ...]]:
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+        
+        keys = self.band_keys(self.signature(tokens))
+        
+        with self._lock:
+            self._cache[key] = keys
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        
+        return keys
+    
+    def estimate_similarity(self, signature1: Tuple[int, ...], signature2: Tuple[int, ...]) -> float:
+        if not signature1 or not signature2:
+            return 0.0
+        return sum(1 for x, y in zip(signature1, signature2) if x == y) / len(signature1)
+
 class TextAnalyzer:
     def __init__(self):
         self.similarity_threshold = SIMILARITY_THRESHOLD
         self.stop_words = self._load_stop_words()
+        self.lsh = MinHashLSH() if LSH_ENABLED else None
+        self.scoring_mode = SCORING_MODE
+        self.sequence_engine = SEQUENCE_ENGINE
+        self.weights = [0.3, 0.3, 0.2, 0.2]
+        self.feature_cache_size = FEATURE_CACHE_SIZE
+        self._feature_cache = OrderedDict()
+        self._feature_lock = threading.Lock()
         
     def _load_stop_words(self) -> Set[str]:
         common_words = {
@@ -22,39 +155,57 @@ class TextAnalyzer:
         return common_words
     
     def extract_sentences(self, text: str) -> List[str]:
-        text = self._clean_text(text)
-        
-        sentence_patterns = [
-            r'[.!?]+\s+(?=[A-Z])',
-            r'[.!?]+$',
-            r'\n\s*\n',
-            r';\s+(?=[A-Z])'
-        ]
+        return [sentence for sentence, _, _, _ in self.iter_sentences(text)]
+    
+    def iter_sentences(self, text: str) -> Iterator[Tuple[str, int, int, List[str]]]:
+        offsets = OffsetMap(text)
+        text = offsets.cleaned
+        lowered = text.lower()
+        aligned = len(lowered) == len(text)
+        stop_words = self.stop_words
         
-        sentences = [text]
-        for pattern in sentence_patterns:
-            new_sentences = []
-            for sentence in sentences:
-                parts = re.split(pattern, sentence)
-                new_sentences.extend([p.strip() for p in parts if p.strip()])
-            sentences = new_sentences
-        
-        filtered_sentences = []
-        for sentence in sentences:
-            words = self._extract_words(sentence)
+        for start, end in self.iter_sentence_spans(text):
+            sentence = text[start:end]
+            if aligned:
+                words = [w for w in _WORD_PATTERN.findall(lowered, start, end) if len(w) > 2 and w not in stop_words]
+            else:
+                words = self._extract_words(sentence)
             if MIN_SENTENCE_WORDS <= len(words) <= MAX_SENTENCE_WORDS:
                 if self._is_meaningful_sentence(sentence, words):
-                    filtered_sentences.append(sentence.strip())
+                    yield (sentence,) + offsets.span(start, end) + (words,)
+    
+    def iter_sentence_spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        position = 0
+        
+        for boundary in _SENTENCE_BOUNDARY.finditer(text):
+            span = self._trim_span(text, position, boundary.start(), boundary.group('stop') is not None)
+            if span:
+                yield span
+            position = boundary.end()
         
-        return filtered_sentences
+        span = self._trim_span(text, position, len(text), True)
+        if span:
+            yield span
+    
+    def _trim_span(self, text: str, start: int, end: int, strip_stop: bool) -> Optional[Tuple[int, int]]:
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        
+        if strip_stop and end > start and text[end - 1] in '.!?':
+            while end > start and text[end - 1] in '.!?':
+                end -= 1
+            while end > start and text[end - 1].isspace():
+                end -= 1
+        
+        return (start, end) if end > start else None
     
     def _clean_text(self, text: str) -> str:
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[^\w\s\.\!\?\;\:\,\-\'\"]', ' ', text)
-        return text.strip()
+        return clean_text(text)
     
     def _extract_words(self, text: str) -> List[str]:
-        words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
+        words = _WORD_PATTERN.findall(text.lower())
         return [w for w in words if len(w) > 2 and w not in self.stop_words]
     
     def _is_meaningful_sentence(self, sentence: str, words: List[str]) -> bool:
@@ -68,36 +219,90 @@ class TextAnalyzer:
         if not text1 or not text2:
             return 0.0
         
-        text1_clean = self._normalize_text(text1)
-        text2_clean = self._normalize_text(text2)
+        features1 = self.get_features(text1)
+        features2 = self.get_features(text2)
         
-        if not text1_clean or not text2_clean:
+        if not features1.normalized or not features2.normalized:
             return 0.0
         
-        sequence_sim = self._sequence_similarity(text1_clean, text2_clean)
-        semantic_sim = self._semantic_similarity(text1_clean, text2_clean)
-        structural_sim = self._structural_similarity(text1_clean, text2_clean)
-        lexical_sim = self._lexical_similarity(text1_clean, text2_clean)
+        sequence_sim = self._sequence_features(features1, features2)
+        semantic_sim = self._semantic_similarity(features1, features2)
+        structural_sim = self._structural_similarity(features1, features2)
+        lexical_sim = self._lexical_similarity(features1, features2)
         
-        weights = [0.3, 0.3, 0.2, 0.2]
-        similarities = [sequence_sim, semantic_sim, structural_sim, lexical_sim]
+        return self._weighted_total(sequence_sim, semantic_sim, structural_sim, lexical_sim)
+    
+    def get_features(self, text: str) -> TextFeatures:
+        with self._feature_lock:
+            features = self._feature_cache.get(text)
+            if features is not None:
+                self._feature_cache.move_to_end(text)
+                return features
         
-        final_similarity = sum(w * s for w, s in zip(weights, similarities))
+        normalized = self._normalize_text(text)
+        features = TextFeatures(normalized, self._extract_words(normalized))
         
-        return min(1.0, max(0.0, final_similarity))
+        with self._feature_lock:
+            self._feature_cache[text] = features
+            if len(self._feature_cache) > self.feature_cache_size:
+                self._feature_cache.popitem(last=False)
+        
+        return features
     
     def _normalize_text(self, text: str) -> str:
         text = text.lower().strip()
-        text = text.translate(str.maketrans('', '', string.punctuation))
-        text = re.sub(r'\s+', ' ', text)
+        text = text.translate(_PUNCTUATION_TABLE)
+        text = _WHITESPACE.sub(' ', text)
         return text
     
-    def _sequence_similarity(self, text1: str, text2: str) -> float:
-        return SequenceMatcher(None, text1, text2).ratio()
+    def _sequence_similarity(self, text1: str, text2: str, floor: float = 0.0) -> float:
+        if self.sequence_engine == 'lcs':
+            return self._lcs_ratio(text1, text2, floor)
+        elif self.sequence_engine == 'token_lcs':
+            return self._lcs_ratio(text1.split(), text2.split(), floor)
+        
+        matcher = SequenceMatcher(None, text1, text2)
+        if floor > 0:
+            bound = matcher.quick_ratio()
+            if bound < floor:
+                return bound
+        return matcher.ratio()
+    
+    def _sequence_features(self, features1: TextFeatures, features2: TextFeatures, floor: float = 0.0) -> float:
+        if self.sequence_engine == 'token_lcs':
+            return self._lcs_ratio(features1.tokens, features2.tokens, floor)
+        return self._sequence_similarity(features1.normalized, features2.normalized, floor)
+    
+    def _lcs_ratio(self, seq1, seq2, floor: float = 0.0) -> float:
+        if not seq1 or not seq2:
+            return 0.0
+        
+        if len(seq1) < len(seq2):
+            seq1, seq2 = seq2, seq1
+        
+        total = len(seq1) + len(seq2)
+        width = len(seq1)
+        full = (1 << width) - 1
+        
+        masks = {}
+        for position, item in enumerate(seq1):
+            masks[item] = masks.get(item, 0) | (1 << position)
+        
+        vector = full
+        for position, item in enumerate(seq2, 1):
+            matches = vector & masks.get(item, 0)
+            vector = ((vector + matches) | (vector - matches)) & full
+            
+            if floor > 0 and position % LCS_CHECK_INTERVAL == 0:
+                bound = 2 * (width - bin(vector).count('1') + len(seq2) - position) / total
+                if bound < floor:
+                    return bound
+        
+        return 2 * (width - bin(vector).count('1')) / total
     
-    def _semantic_similarity(self, text1: str, text2: str) -> float:
-        words1 = set(self._extract_words(text1))
-        words2 = set(self._extract_words(text2))
+    def _semantic_similarity(self, features1: TextFeatures, features2: TextFeatures) -> float:
+        words1 = features1.word_set
+        words2 = features2.word_set
         
         if not words1 or not words2:
             return 0.0
@@ -111,72 +316,246 @@ class TextAnalyzer:
         
         return (jaccard_sim + overlap_ratio) / 2
     
-    def _structural_similarity(self, text1: str, text2: str) -> float:
-        len1, len2 = len(text1), len(text2)
+    def _structural_similarity(self, features1: TextFeatures, features2: TextFeatures) -> float:
+        len1, len2 = features1.length, features2.length
         if len1 == 0 or len2 == 0:
             return 0.0
         
         length_sim = 1 - abs(len1 - len2) / max(len1, len2)
         
-        words1, words2 = text1.split(), text2.split()
-        word_count_sim = 1 - abs(len(words1) - len(words2)) / max(len(words1), len(words2))
+        count1, count2 = features1.token_count, features2.token_count
+        word_count_sim = 1 - abs(count1 - count2) / max(count1, count2)
         
         return (length_sim + word_count_sim) / 2
     
-    def _lexical_similarity(self, text1: str, text2: str) -> float:
-        words1 = text1.split()
-        words2 = text2.split()
+    def _lexical_similarity(self, features1: TextFeatures, features2: TextFeatures) -> float:
+        if not features1.token_count or not features2.token_count:
+            return 0.0
         
-        if not words1 or not words2:
+        counter1, counter2 = features1.counter, features2.counter
+        if len(counter1) > len(counter2):
+            counter1, counter2 = counter2, counter1
+        
+        cosine_sim = sum(count * counter2[word] for word, count in counter1.items() if word in counter2)
+        
+        if features1.norm * features2.norm == 0:
             return 0.0
         
-        counter1 = Counter(words1)
-        counter2 = Counter(words2)
+        return cosine_sim / (features1.norm * features2.norm)
+    
+    def analyze_sentence(self, sentence: str, search_results: List[Dict]) -> SentenceResult:
+        if self.lsh is not None and len(search_results) > LSH_MIN_CANDIDATES:
+            search_results = self.filter_candidates(sentence, search_results)
         
-        all_words = set(words1 + words2)
-        cosine_sim = sum(counter1[word] * counter2[word] for word in all_words)
+        snippets = [r['snippet'] for r in search_results]
+        if self.scoring_mode == 'process':
+            best_index, similarity = self.get_scoring_pool().best_matches(
+                [sentence], [snippets], self.sequence_engine, self.weights, self.get_features
+            )[0]
+        else:
+            best_index, similarity = self.best_match(sentence, snippets)
         
-        norm1 = sum(count * count for count in counter1.values()) ** 0.5
-        norm2 = sum(count * count for count in counter2.values()) ** 0.5
+        return self._build_match(sentence, search_results, best_index, similarity)
+    
+    def analyze_sentences(self, items: List[Tuple[str, List[Dict]]]) -> List[SentenceResult]:
+        if self.scoring_mode != 'process':
+            return [self.analyze_sentence(sentence, search_results) for sentence, search_results in items]
         
-        if norm1 * norm2 == 0:
-            return 0.0
+        filtered = [
+            self.filter_candidates(sentence, search_results)
+            if self.lsh is not None and len(search_results) > LSH_MIN_CANDIDATES else search_results
+            for sentence, search_results in items
+        ]
+        matches = self.get_scoring_pool().best_matches(
+            [sentence for sentence, _ in items],
+            [[r['snippet'] for r in search_results] for search_results in filtered],
+            self.sequence_engine, self.weights, self.get_features
+        )
         
-        return cosine_sim / (norm1 * norm2)
-    
-    def analyze_sentence(self, sentence: str, search_results: List[Dict]) -> Dict:
-        best_match = {
-            'sentence': sentence,
-            'similarity': 0.0,
-            'source': None,
-            'source_title': '',
-            'source_domain': '',
-            'matched_text': '',
-            'is_plagiarism': False,
-            'confidence_level': 'very_low',
-            'risk_score': 0
-        }
+        return [
+            self._build_match(sentence, search_results, best_index, similarity)
+            for (sentence, _), search_results, (best_index, similarity) in zip(items, filtered, matches)
+        ]
+    
+    def get_scoring_pool(self):
+        from scoring_pool import get_shared_pool
+        return get_shared_pool()
+    
+    def best_match(self, sentence: str, snippets: List[str]) -> Tuple:
+        if self.scoring_mode == 'pruned':
+            return self._find_best_match_pruned(sentence, snippets)
         
-        for result in search_results:
-            similarity = self.calculate_similarity(sentence, result['snippet'])
+        if self.scoring_mode == 'batch' and len(snippets) > 1:
+            similarities = self.score_batch(sentence, snippets)
+        else:
+            similarities = (self.calculate_similarity(sentence, snippet) for snippet in snippets)
+        
+        best_index, similarity = None, 0.0
+        for index, candidate_similarity in enumerate(similarities):
+            if candidate_similarity > similarity:
+                best_index, similarity = index, candidate_similarity
+        
+        return best_index, similarity
+    
+    def _build_match(self, sentence: str, search_results: List[Dict],
+                     best_index: Optional[int], similarity: float) -> SentenceResult:
+        if best_index is None:
+            return SentenceResult(sentence)
+        
+        result = search_results[best_index]
+        return SentenceResult(
+            sentence,
+            similarity=similarity,
+            source=result['link'],
+            source_title=result['title'],
+            source_domain=result['display_link'],
+            matched_text=result['snippet'],
+            is_plagiarism=similarity > self.similarity_threshold,
+            confidence_level=self._calculate_confidence(similarity),
+            risk_score=self._calculate_risk_score(similarity)
+        )
+    
+    def _find_best_match_pruned(self, sentence: str, snippets: List[str]) -> Tuple:
+        features1 = self.get_features(sentence) if sentence else None
+        return self.best_match_features(features1, (self.get_features(s) if s else None for s in snippets))
+    
+    def best_match_features(self, features1: Optional[TextFeatures],
+                            candidates: Iterable[Optional[TextFeatures]]) -> Tuple:
+        best_index, best_similarity = None, 0.0
+        
+        if features1 is None or not features1.normalized:
+            return best_index, best_similarity
+        
+        w_seq = self.weights[0]
+        
+        for index, features2 in enumerate(candidates):
+            if features2 is None or not features2.normalized:
+                continue
+            
+            structural_sim = self._structural_similarity(features1, features2)
+            lexical_sim = self._lexical_similarity(features1, features2)
+            if self._weighted_total(1.0, 1.0, structural_sim, lexical_sim) <= best_similarity:
+                continue
+            
+            semantic_sim = self._semantic_similarity(features1, features2)
+            if self._weighted_total(1.0, semantic_sim, structural_sim, lexical_sim) <= best_similarity:
+                continue
+            
+            partial = self._weighted_total(0.0, semantic_sim, structural_sim, lexical_sim)
+            floor = max(0.0, (best_similarity - partial) / w_seq - PRUNING_MARGIN)
+            sequence_sim = self._sequence_features(features1, features2, floor)
+            if sequence_sim < floor:
+                continue
             
-            if similarity > best_match['similarity']:
-                confidence = self._calculate_confidence(similarity)
-                risk_score = self._calculate_risk_score(similarity)
+            similarity = self._weighted_total(sequence_sim, semantic_sim, structural_sim, lexical_sim)
+            if similarity > best_similarity:
+                best_index, best_similarity = index, similarity
                 
-                best_match = {
-                    'sentence': sentence,
-                    'similarity': similarity,
-                    'source': result['link'],
-                    'source_title': result['title'],
-                    'source_domain': result['display_link'],
-                    'matched_text': result['snippet'],
-                    'is_plagiarism': similarity > self.similarity_threshold,
-                    'confidence_level': confidence,
-                    'risk_score': risk_score
-                }
-        
-        return best_match
+                if best_similarity >= CERTAIN_MATCH_THRESHOLD:
+                    break
+        
+        return best_index, best_similarity
+    
+    def _weighted_total(self, sequence_sim: float, semantic_sim: float,
+                        structural_sim: float, lexical_sim: float) -> float:
+        similarities = [sequence_sim, semantic_sim, structural_sim, lexical_sim]
+        final_similarity = sum(w * s for w, s in zip(self.weights, similarities))
+        return min(1.0, max(0.0, final_similarity))
+    
+    def score_batch(self, sentence: str, snippets: List[str]) -> List[float]:
+        return self.score_matrix([sentence], snippets)[0]
+    
+    def score_matrix(self, sentences: List[str], snippets: List[str]) -> List[List[float]]:
+        np = _load_numpy()
+        if np is None:
+            return [[self.calculate_similarity(s, t) for t in snippets] for s in sentences]
+        
+        if not sentences or not snippets:
+            return [[] for _ in sentences]
+        
+        empty = TextFeatures('', [])
+        features1 = [self.get_features(s) if s else empty for s in sentences]
+        features2 = [self.get_features(t) if t else empty for t in snippets]
+        
+        valid = np.outer(
+            np.array([bool(f.normalized) for f in features1]),
+            np.array([bool(f.normalized) for f in features2])
+        )
+        
+        set_matrix1, set_matrix2 = self._build_matrices(
+            [f.word_set for f in features1], [f.word_set for f in features2]
+        )
+        count_matrix1, count_matrix2 = self._build_matrices(
+            [f.counter for f in features1], [f.counter for f in features2]
+        )
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            intersection = set_matrix1 @ set_matrix2.T
+            size1 = set_matrix1.sum(axis=1)[:, None]
+            size2 = set_matrix2.sum(axis=1)[None, :]
+            union = size1 + size2 - intersection
+            jaccard = np.where(union > 0, intersection / union, 0.0)
+            overlap = intersection / np.minimum(size1, size2)
+            semantic = np.where((size1 > 0) & (size2 > 0), (jaccard + overlap) / 2, 0.0)
+            
+            len1 = np.array([f.length for f in features1], dtype=float)[:, None]
+            len2 = np.array([f.length for f in features2], dtype=float)[None, :]
+            wc1 = np.array([f.token_count for f in features1], dtype=float)[:, None]
+            wc2 = np.array([f.token_count for f in features2], dtype=float)[None, :]
+            length_sim = 1 - np.abs(len1 - len2) / np.maximum(len1, len2)
+            word_count_sim = 1 - np.abs(wc1 - wc2) / np.maximum(wc1, wc2)
+            structural = (length_sim + word_count_sim) / 2
+            
+            dot = count_matrix1 @ count_matrix2.T
+            norms = np.sqrt((count_matrix1 ** 2).sum(axis=1))[:, None] * \
+                np.sqrt((count_matrix2 ** 2).sum(axis=1))[None, :]
+            lexical = np.where(norms > 0, dot / norms, 0.0)
+        
+        sequence = np.zeros(valid.shape)
+        for i, j in zip(*np.nonzero(valid)):
+            sequence[i, j] = self._sequence_features(features1[i], features2[j])
+        
+        w_seq, w_sem, w_struct, w_lex = self.weights
+        total = w_seq * sequence + w_sem * semantic + w_struct * structural + w_lex * lexical
+        total = np.where(valid, np.clip(np.nan_to_num(total), 0.0, 1.0), 0.0)
+        
+        return total.tolist()
+    
+    def _build_matrices(self, features1: List, features2: List) -> Tuple:
+        np = _load_numpy()
+        vocabulary = {}
+        for feature in features1 + features2:
+            for word in feature:
+                vocabulary.setdefault(word, len(vocabulary))
+        
+        matrices = []
+        for features in (features1, features2):
+            matrix = np.zeros((len(features), max(1, len(vocabulary))))
+            for row, feature in enumerate(features):
+                if isinstance(feature, Counter):
+                    for word, count in feature.items():
+                        matrix[row, vocabulary[word]] = count
+                else:
+                    for word in feature:
+                        matrix[row, vocabulary[word]] = 1.0
+            matrices.append(matrix)
+        
+        return tuple(matrices)
+    
+    def filter_candidates(self, sentence: str, search_results: List[Dict]) -> List[Dict]:
+        sentence_keys = self.lsh.band_keys(self.lsh.signature(self.get_features(sentence).words))
+        
+        if not sentence_keys:
+            return search_results
+        
+        survivors = []
+        for result in search_results:
+            snippet = result['snippet']
+            snippet_keys = self.lsh.cached_band_keys(snippet, self.get_features(snippet).words)
+            if sentence_keys & snippet_keys:
+                survivors.append(result)
+        
+        return survivors
     
     def _calculate_confidence(self, similarity: float) -> str:
         if similarity >= 0.9:
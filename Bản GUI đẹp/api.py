@@ -1,33 +1,103 @@
-import requests
 import time
 import json
-from typing import List, Dict, Optional
+import asyncio
+import threading
+from typing import List, Dict, Optional, Iterable
+from email.utils import parsedate_to_datetime
+from http_client import AsyncHTTPClient, HTTPClientError, HTTPResponse, run_sync
+from ratelimit import RateLimiter, get_shared_limiter
+from cache import SearchCache
+from retry import RetryPolicy, CircuitBreaker
+from backends import SearchBackend
 from config import *
 
-class GoogleSearchAPI:
-    def __init__(self):
+class SearchAPIError(Exception):
+    def __init__(self, message: str, status_code: Optional[int] = None,
+                 retry_after: Optional[float] = None, retryable: bool = False):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.retryable = retryable
+
+def parse_retry_after(response: HTTPResponse) -> Optional[float]:
+    value = response.headers.get('retry-after')
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class GoogleSearchAPI(SearchBackend):
+    name = 'google'
+    
+    def __init__(self, rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[SearchCache] = None,
+                 http_client: Optional[AsyncHTTPClient] = None,
+                 retry_policy: Optional[RetryPolicy] = None):
         self.api_key = API_KEY
         self.search_engine_id = SEARCH_ENGINE_ID
         self.base_url = BASE_URL
         self.requests_made = 0
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'PlagiarismChecker/1.0 (Educational Purpose)'
-        })
+        self.rate_limiter = rate_limiter or get_shared_limiter()
+        self._counter_lock = threading.Lock()
+        self.cache = cache if cache is not None else (SearchCache() if CACHE_ENABLED else None)
+        self.http = http_client or AsyncHTTPClient(
+            headers={'User-Agent': 'PlagiarismChecker/1.0 (Educational Purpose)'}
+        )
+        self.retry_policy = retry_policy or RetryPolicy(breaker=CircuitBreaker())
         
     def test_connection(self) -> bool:
+        return self.probe() != 'unhealthy'
+    
+    def probe(self) -> str:
+        return run_sync(self.probe_async())
+    
+    async def probe_async(self) -> str:
         try:
-            result = self.search("python programming test", max_results=1)
-            return len(result) > 0
-        except Exception:
-            return False
+            response = await self.http.get(self.base_url, timeout=HEALTH_PROBE_TIMEOUT)
+        except HTTPClientError:
+            return 'unhealthy'
+        
+        if response.status_code >= 500:
+            return 'unhealthy'
+        elif response.status_code < 400:
+            return 'healthy'
+        return 'reachable'
     
     def search(self, query: str, max_results: int = MAX_RESULTS_PER_SEARCH) -> List[Dict]:
+        return run_sync(self.search_async(query, max_results))
+    
+    def search_many(self, queries: Iterable[str], max_results: int = MAX_RESULTS_PER_SEARCH) -> List[List[Dict]]:
+        return run_sync(self.search_many_async(queries, max_results))
+    
+    async def search_many_async(self, queries: Iterable[str],
+                                max_results: int = MAX_RESULTS_PER_SEARCH) -> List[List[Dict]]:
+        return list(await asyncio.gather(*(self.search_async(query, max_results) for query in queries)))
+    
+    async def search_async(self, query: str, max_results: int = MAX_RESULTS_PER_SEARCH) -> List[Dict]:
         if not query or len(query.strip()) < 4:
             return []
             
         query_cleaned = self._clean_query(query.strip())
+        cache_key = f"{max_results}:{query_cleaned}"
         
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        return await self.retry_policy.call_async(
+            lambda: self._fetch_async(query_cleaned, cache_key, max_results)
+        )
+    
+    async def _fetch_async(self, query_cleaned: str, cache_key: str, max_results: int) -> List[Dict]:
         params = {
             'key': self.api_key,
             'cx': self.search_engine_id,
@@ -40,13 +110,12 @@ class GoogleSearchAPI:
             'filter': '1'
         }
         
+        await self.rate_limiter.acquire_async()
+        
         try:
-            response = self.session.get(
-                self.base_url, 
-                params=params, 
-                timeout=20
-            )
-            self.requests_made += 1
+            response = await self.http.get(self.base_url, params=params)
+            with self._counter_lock:
+                self.requests_made += 1
             
             if response.status_code == 200:
                 data = response.json()
@@ -63,22 +132,31 @@ class GoogleSearchAPI:
                             'formatted_url': item.get('formattedUrl', '').strip()
                         })
                 
-                time.sleep(REQUEST_DELAY)
-                return results[:max_results]
+                results = results[:max_results]
+                if self.cache is not None:
+                    self.cache.put(cache_key, results)
+                return results
                 
             elif response.status_code == 403:
-                raise Exception("API quota exceeded or invalid credentials")
+                raise SearchAPIError("API quota exceeded or invalid credentials", 403)
             elif response.status_code == 429:
-                raise Exception("Rate limit exceeded")
+                raise SearchAPIError("Rate limit exceeded", 429, parse_retry_after(response), retryable=True)
             else:
-                raise Exception(f"API request failed with status {response.status_code}")
+                raise SearchAPIError(f"API request failed with status {response.status_code}",
+                                     response.status_code, parse_retry_after(response),
+                                     retryable=response.status_code >= 500)
                 
-        except requests.RequestException as e:
-            raise Exception(f"Network error: {str(e)}")
+        except HTTPClientError as e:
+            raise SearchAPIError(f"Network error: {str(e)}", retryable=True)
         except json.JSONDecodeError:
-            raise Exception("Invalid response format from API")
+            raise SearchAPIError("Invalid response format from API")
+        except SearchAPIError as e:
+            raise SearchAPIError(f"Search failed: {str(e)}", e.status_code, e.retry_after, e.retryable)
         except Exception as e:
-            raise Exception(f"Search failed: {str(e)}")
+            raise SearchAPIError(f"Search failed: {str(e)}")
+    
+    def normalize_query(self, query: str) -> str:
+        return self._clean_query(query.strip())
     
     def _clean_query(self, query: str) -> str:
         import re
@@ -90,4 +168,22 @@ class GoogleSearchAPI:
         return self.requests_made
     
     def get_remaining_requests(self) -> int:
-        return max(0, MAX_REQUESTS_PER_DAY - self.requests_made)
\ No newline at end of file
+        return max(0, MAX_REQUESTS_PER_DAY - self.requests_made)
+    
+    def get_cache_hits(self) -> int:
+        return self.cache.hits if self.cache is not None else 0
+    
+    def get_cache_misses(self) -> int:
+        return self.cache.misses if self.cache is not None else 0
+    
+    def get_throttle_time(self) -> float:
+        return self.rate_limiter.get_throttled_time()
+    
+    def start_retry_budget(self, documents: int = 1):
+        self.retry_policy.start_budget(RETRY_BUDGET_PER_DOCUMENT * max(1, documents))
+    
+    def get_retry_count(self) -> int:
+        return self.retry_policy.get_retry_count()
+    
+    def get_circuit_trips(self) -> int:
+        return self.retry_policy.get_trip_count()
\ No newline at end of file
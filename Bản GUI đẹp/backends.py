@@ -0,0 +1,227 @@
+import re
+import time
+import random
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter, defaultdict
+from typing import List, Dict, Optional, Callable, Iterable
+from config import *
+
+class SearchBackend(ABC):
+    name = 'base'
+    
+    @abstractmethod
+    def search(self, query: str, max_results: int = MAX_RESULTS_PER_SEARCH) -> List[Dict]:
+        pass
+    
+    def search_many(self, queries: Iterable[str], max_results: int = MAX_RESULTS_PER_SEARCH) -> List[List[Dict]]:
+        return [self.search(query, max_results) for query in queries]
+    
+    def test_connection(self) -> bool:
+        try:
+            self.search("python programming test", max_results=1)
+            return True
+        except Exception:
+            return False
+    
+    def probe(self) -> str:
+        return 'healthy' if self.test_connection() else 'unhealthy'
+    
+    def normalize_query(self, query: str) -> str:
+        return ' '.join(query.split())
+    
+    def get_requests_made(self) -> int:
+        return 0
+    
+    def get_remaining_requests(self) -> int:
+        return max(0, MAX_REQUESTS_PER_DAY - self.get_requests_made())
+    
+    def get_cache_hits(self) -> int:
+        return 0
+    
+    def get_cache_misses(self) -> int:
+        return 0
+    
+    def get_throttle_time(self) -> float:
+        return 0.0
+    
+    def start_retry_budget(self, documents: int = 1):
+        pass
+    
+    def get_retry_count(self) -> int:
+        return 0
+    
+    def get_circuit_trips(self) -> int:
+        return 0
+    
+    def get_stats(self) -> Dict:
+        return {
+            'backend': self.name,
+            'requests_made': self.get_requests_made(),
+            'requests_remaining': self.get_remaining_requests()
+        }
+
+class ChainedSearchBackend(SearchBackend):
+    name = 'chain'
+    
+    def __init__(self, backends: List[SearchBackend], threshold: float = CHAIN_RESOLVE_THRESHOLD,
+                 scorer: Optional[Callable[[str, str], float]] = None):
+        if not backends:
+            raise ValueError("At least one backend is required")
+        
+        if scorer is None:
+            from analyzer import TextAnalyzer
+            scorer = TextAnalyzer().calculate_similarity
+        
+        self.backends = list(backends)
+        self.threshold = threshold
+        self.scorer = scorer
+        self.resolved_by = defaultdict(int)
+        self._lock = threading.Lock()
+        
+    def search(self, query: str, max_results: int = MAX_RESULTS_PER_SEARCH) -> List[Dict]:
+        collected = []
+        
+        for index, backend in enumerate(self.backends):
+            results = backend.search(query, max_results)
+            collected.extend(results)
+            
+            is_last = index == len(self.backends) - 1
+            if is_last or self._is_resolved(query, results):
+                with self._lock:
+                    self.resolved_by[backend.name] += 1
+                return collected
+        
+        return collected
+    
+    def _is_resolved(self, query: str, results: List[Dict]) -> bool:
+        return any(self.scorer(query, result['snippet']) >= self.threshold for result in results)
+    
+    def test_connection(self) -> bool:
+        return any(backend.test_connection() for backend in self.backends)
+    
+    def probe(self) -> str:
+        outcomes = [backend.probe() for backend in self.backends]
+        for status in ('healthy', 'reachable'):
+            if status in outcomes:
+                return status
+        return 'unhealthy'
+    
+    def normalize_query(self, query: str) -> str:
+        return self.backends[-1].normalize_query(query)
+    
+    def get_requests_made(self) -> int:
+        return sum(backend.get_requests_made() for backend in self.backends)
+    
+    def get_remaining_requests(self) -> int:
+        return min(backend.get_remaining_requests() for backend in self.backends)
+    
+    def get_cache_hits(self) -> int:
+        return sum(backend.get_cache_hits() for backend in self.backends)
+    
+    def get_cache_misses(self) -> int:
+        return sum(backend.get_cache_misses() for backend in self.backends)
+    
+    def get_throttle_time(self) -> float:
+        return sum(backend.get_throttle_time() for backend in self.backends)
+    
+    def start_retry_budget(self, documents: int = 1):
+        for backend in self.backends:
+            backend.start_retry_budget(documents)
+    
+    def get_retry_count(self) -> int:
+        return sum(backend.get_retry_count() for backend in self.backends)
+    
+    def get_circuit_trips(self) -> int:
+        return sum(backend.get_circuit_trips() for backend in self.backends)
+    
+    def get_stats(self) -> Dict:
+        stats = super().get_stats()
+        stats['resolved_by'] = dict(self.resolved_by)
+        stats['backends'] = [backend.get_stats() for backend in self.backends]
+        return stats
+
+class FakeSearchBackend(SearchBackend):
+    name = 'fake'
+    
+    def __init__(self, passages: Optional[List[str]] = None, latency: float = 0.0, seed: int = 0):
+        self.passages = list(passages or [])
+        self.latency = latency
+        self.seed = seed
+        self.requests_made = 0
+        self._lock = threading.Lock()
+        self._postings = defaultdict(list)
+        
+        for index, passage in enumerate(self.passages):
+            for word in set(self._words(passage)):
+                self._postings[word].append(index)
+        
+    def search(self, query: str, max_results: int = MAX_RESULTS_PER_SEARCH) -> List[Dict]:
+        if not query or len(query.strip()) < 4:
+            return []
+        
+        if self.latency > 0:
+            time.sleep(self.latency)
+        
+        with self._lock:
+            self.requests_made += 1
+        
+        if self.passages:
+            snippets = self._lookup(query, max_results)
+        else:
+            snippets = self._synthesize(query, max_results)
+        
+        return [
+            {
+                'title': f"Fake source {index}",
+                'link': f"https://fake.example/source/{index}",
+                'snippet': snippet,
+                'display_link': 'fake.example',
+                'formatted_url': f"https://fake.example/source/{index}"
+            }
+            for index, snippet in snippets
+        ]
+    
+    def _words(self, text: str) -> List[str]:
+        return re.findall(r'\w+', text.lower())
+    
+    def _lookup(self, query: str, max_results: int) -> List[tuple]:
+        scores = Counter()
+        for word in set(self._words(query)):
+            for index in self._postings.get(word, ()):
+                scores[index] += 1
+        
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:max_results]
+        return [(index, self.passages[index]) for index, _ in ranked]
+    
+    def _synthesize(self, query: str, max_results: int) -> List[tuple]:
+        digest = hashlib.md5(f"{self.seed}:{query}".encode('utf-8')).hexdigest()
+        rng = random.Random(int(digest, 16))
+        words = query.split()
+        snippets = []
+        
+        for index in range(max_results):
+            variant = [word for word in words if rng.random() > 0.15 * index]
+            snippets.append((int(digest[:8], 16) + index, ' '.join(variant) or query))
+        
+        return snippets
+    
+    def get_requests_made(self) -> int:
+        return self.requests_made
+
+def create_backend(name: str = SEARCH_BACKEND) -> SearchBackend:
+    if name == 'google':
+        from api import GoogleSearchAPI
+        return GoogleSearchAPI()
+    elif name == 'local':
+        from corpus import LocalCorpusSearch
+        return LocalCorpusSearch()
+    elif name == 'chain':
+        from api import GoogleSearchAPI
+        from corpus import LocalCorpusSearch
+        return ChainedSearchBackend([LocalCorpusSearch(), GoogleSearchAPI()])
+    elif name == 'fake':
+        return FakeSearchBackend()
+    else:
+        raise ValueError(f"Unknown search backend: {name}")
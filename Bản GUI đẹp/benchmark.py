@@ -0,0 +1,296 @@
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+from analyzer import TextAnalyzer
+from backends import FakeSearchBackend
+from checker import PlagiarismChecker
+from metrics import Histogram
+from config import *
+
+VOCABULARY = """
+research analysis system model method data network learning process energy
+structure function theory evidence experiment result language history culture
+economy market policy government education student teacher knowledge science
+technology computer software hardware memory signal pattern image sound music
+climate ocean forest river mountain species population growth change temperature
+pressure material surface particle molecule protein genome cell tissue organism
+medicine disease treatment patient hospital doctor health nutrition exercise sleep
+city village transport vehicle engine railway bridge building design architecture
+literature poetry novel author reader article journal review critique argument
+philosophy ethics logic reason belief value society community family tradition
+industry production supply demand price trade export import currency finance
+strategy decision planning management leadership organization team project goal
+""".split()
+
+VERBS = """
+improves reduces explains predicts supports changes shapes measures describes
+influences requires produces reveals connects transforms limits enables follows
+""".split()
+
+CONNECTORS = ['because', 'while', 'although', 'since', 'whereas', 'after', 'before', 'unless']
+
+def make_sentence(rng: random.Random, min_words: int = 10, max_words: int = 18) -> str:
+    length = rng.randint(min_words, max_words)
+    words = []
+    
+    while len(words) < length:
+        words.extend([rng.choice(VOCABULARY), rng.choice(VERBS), rng.choice(VOCABULARY)])
+        if len(words) < length - 3:
+            words.append(rng.choice(CONNECTORS))
+    
+    words = words[:length]
+    return words[0].capitalize() + ' ' + ' '.join(words[1:]) + '.'
+
+def paraphrase(sentence: str, intensity: float, rng: random.Random) -> str:
+    words = sentence.rstrip('.').lower().split()
+    
+    for i in range(len(words)):
+        if rng.random() < intensity:
+            words[i] = rng.choice(VOCABULARY)
+    
+    swaps = int(len(words) * intensity / 2)
+    for _ in range(swaps):
+        i, j = rng.randrange(len(words)), rng.randrange(len(words))
+        words[i], words[j] = words[j], words[i]
+    
+    return words[0].capitalize() + ' ' + ' '.join(words[1:]) + '.'
+
+def generate_corpus(sentences: int = 200, plagiarism_rate: float = 0.3, intensity: float = 0.2,
+                    decoys: int = 500, seed: int = 42) -> Tuple[str, List[str]]:
+    rng = random.Random(seed)
+    document = []
+    sources = []
+    
+    for _ in range(sentences):
+        sentence = make_sentence(rng)
+        if rng.random() < plagiarism_rate:
+            sources.append(sentence)
+            document.append(paraphrase(sentence, intensity, rng))
+        else:
+            document.append(sentence)
+    
+    sources.extend(make_sentence(rng) for _ in range(decoys))
+    rng.shuffle(sources)
+    
+    paragraphs = [' '.join(document[i:i + 5]) for i in range(0, len(document), 5)]
+    return '\n\n'.join(paragraphs), sources
+
+def measure(func: Callable, repeat: int) -> Tuple[Histogram, float, object]:
+    histogram = Histogram()
+    result = None
+    start = time.perf_counter()
+    
+    for _ in range(max(1, repeat)):
+        call_start = time.perf_counter()
+        result = func()
+        histogram.observe(time.perf_counter() - call_start)
+    
+    return histogram, time.perf_counter() - start, result
+
+def peak_memory(func: Callable) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def bench_extract(text: str, repeat: int) -> Dict:
+    analyzer = TextAnalyzer()
+    histogram, elapsed, sentences = measure(lambda: analyzer.extract_sentences(text), repeat)
+    
+    return {
+        'sentences': len(sentences),
+        'sentences_per_sec': round(len(sentences) * histogram.count / elapsed, 1),
+        'latency_ms': histogram.summary(),
+        'peak_memory_kb': round(peak_memory(lambda: analyzer.extract_sentences(text)) / 1024, 1)
+    }
+
+def bench_similarity(text: str, backend: FakeSearchBackend, repeat: int) -> Dict:
+    pairs = [
+        (sentence, result['snippet'])
+        for sentence in TextAnalyzer().extract_sentences(text)
+        for result in backend.search(sentence)
+    ]
+    histogram = Histogram()
+    elapsed = 0.0
+    
+    for _ in range(max(1, repeat)):
+        analyzer = TextAnalyzer()
+        start = time.perf_counter()
+        for sentence, snippet in pairs:
+            pair_start = time.perf_counter()
+            analyzer.calculate_similarity(sentence, snippet)
+            histogram.observe(time.perf_counter() - pair_start)
+        elapsed += time.perf_counter() - start
+    
+    warm_start = time.perf_counter()
+    for sentence, snippet in pairs:
+        analyzer.calculate_similarity(sentence, snippet)
+    warm_elapsed = time.perf_counter() - warm_start
+    
+    def score_all():
+        cold = TextAnalyzer()
+        for sentence, snippet in pairs:
+            cold.calculate_similarity(sentence, snippet)
+    
+    return {
+        'pairs': len(pairs),
+        'pair_scores_per_sec': round(histogram.count / elapsed, 1) if elapsed else 0.0,
+        'warm_pair_scores_per_sec': round(len(pairs) / warm_elapsed, 1) if warm_elapsed else 0.0,
+        'latency_ms': histogram.summary(),
+        'peak_memory_kb': round(peak_memory(score_all) / 1024, 1)
+    }
+
+def bench_check(text: str, sources: List[str], latency: float, workers: int, repeat: int,
+                scoring_mode: str = SCORING_MODE) -> Dict:
+    def run():
+        checker = PlagiarismChecker(FakeSearchBackend(passages=sources, latency=latency))
+        checker.checkpoints = None
+        checker.analyzer.scoring_mode = scoring_mode
+        return checker.check_text(text, max_workers=workers)
+    
+    histogram, elapsed, report = measure(run, repeat)
+    summary = report['summary']
+    performance = report.get('performance', {})
+    scored = performance.get('counters', {}).get('pairs_scored', 0)
+    scoring_time = performance.get('stages', {}).get('scoring', 0.0)
+    
+    return {
+        'sentences': summary['total_sentences'],
+        'plagiarized_sentences': summary['plagiarized_sentences'],
+        'plagiarism_percentage': summary['plagiarism_percentage'],
+        'sentences_per_sec': round(summary['total_sentences'] * histogram.count / elapsed, 1),
+        'pair_scores_per_sec': round(scored / scoring_time, 1) if scoring_time else 0.0,
+        'check_latency_ms': histogram.summary(),
+        'search_latency_ms': performance.get('histograms_ms', {}).get('search_latency'),
+        'pair_scoring_ms': performance.get('histograms_ms', {}).get('pair_scoring'),
+        'peak_memory_kb': round(peak_memory(run) / 1024, 1)
+    }
+
+def run_benchmarks(args) -> Dict:
+    text, sources = generate_corpus(args.sentences, args.plagiarism_rate, args.intensity, args.decoys, args.seed)
+    backend = FakeSearchBackend(passages=sources)
+    
+    return {
+        'config': {
+            'sentences': args.sentences,
+            'plagiarism_rate': args.plagiarism_rate,
+            'intensity': args.intensity,
+            'decoys': args.decoys,
+            'latency': args.latency,
+            'workers': args.workers,
+            'repeat': args.repeat,
+            'seed': args.seed,
+            'scoring_mode': args.scoring_mode,
+            'sequence_engine': SEQUENCE_ENGINE
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
+        },
+        'results': {
+            'extract_sentences': bench_extract(text, args.repeat),
+            'calculate_similarity': bench_similarity(text, backend, args.repeat),
+            'check_text': bench_check(text, sources, args.latency, args.workers, args.repeat, args.scoring_mode)
+        }
+    }
+
+def flatten(data: Dict, prefix: str = '') -> Dict[str, float]:
+    values = {}
+    for key, value in data.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            values.update(flatten(value, name))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            values[name] = value
+    return values
+
+def compare(baseline: Dict, current: Dict, tolerance: float) -> List[Tuple[str, float, float, float, bool]]:
+    old_values = flatten(baseline['results'])
+    new_values = flatten(current['results'])
+    rows = []
+    
+    for name, new in new_values.items():
+        old = old_values.get(name)
+        if old is None or old == 0:
+            continue
+        
+        change = (new - old) / old
+        higher_is_better = name.endswith('_per_sec')
+        lower_is_better = name.endswith(('.p50', '.p95', '.p99', 'peak_memory_kb'))
+        regression = (higher_is_better and change < -tolerance) or (lower_is_better and change > tolerance)
+        rows.append((name, old, new, change, regression))
+    
+    return rows
+
+def print_results(result: Dict):
+    for name, stats in result['results'].items():
+        print(f"\n📊 {name}")
+        for key, value in stats.items():
+            if isinstance(value, dict):
+                print(f"   {key:<24} p50={value['p50']:.3f} p95={value['p95']:.3f} p99={value['p99']:.3f} (n={value['count']})")
+            else:
+                print(f"   {key:<24} {value}")
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Plagiarism Checker Pro - offline benchmark suite")
+    parser.add_argument('-n', '--sentences', type=int, default=200, help="Sentences in the synthetic document")
+    parser.add_argument('-r', '--plagiarism-rate', type=float, default=0.3,
+                        help="Fraction of sentences copied from the source corpus")
+    parser.add_argument('-i', '--intensity', type=float, default=0.2,
+                        help="Paraphrase intensity (fraction of words replaced) for copied sentences")
+    parser.add_argument('-d', '--decoys', type=int, default=500, help="Unrelated passages in the fake backend")
+    parser.add_argument('-l', '--latency', type=float, default=0.0, help="Fake search latency in seconds")
+    parser.add_argument('-w', '--workers', type=int, default=MAX_CONCURRENT_SEARCHES,
+                        help="Number of concurrent searches")
+    parser.add_argument('-m', '--scoring-mode', default=SCORING_MODE,
+                        choices=['pruned', 'batch', 'pairwise', 'process'], help="Scoring mode used by check_text")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed repetitions per benchmark")
+    parser.add_argument('--seed', type=int, default=42, help="Seed for the synthetic corpus")
+    parser.add_argument('-o', '--output', help="Save results as JSON to this file")
+    parser.add_argument('-c', '--compare', help="Compare against a previously saved JSON result")
+    parser.add_argument('-t', '--tolerance', type=float, default=0.1,
+                        help="Relative change treated as a regression when comparing")
+    return parser
+
+def main(argv: List[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    
+    print(f"🚀 Benchmarking {args.sentences} sentences "
+          f"({args.plagiarism_rate:.0%} copied, intensity {args.intensity}, latency {args.latency}s)")
+    result = run_benchmarks(args)
+    print_results(result)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(result, file, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+    
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        
+        rows = compare(baseline, result, args.tolerance)
+        print(f"\n📈 Comparison with {args.compare}")
+        if baseline.get('config') != result['config']:
+            print("⚠️ Benchmark configurations differ, changes may not be comparable")
+        print(f"{'metric':<48}{'baseline':>12}{'current':>12}{'change':>9}")
+        for name, old, new, change, regression in rows:
+            flag = ' ⚠️' if regression else ''
+            print(f"{name:<48}{old:>12.3f}{new:>12.3f}{change:>+9.1%}{flag}")
+        
+        if any(row[4] for row in rows):
+            print("\n❌ Performance regression detected")
+            return 1
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
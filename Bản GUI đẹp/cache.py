@@ -0,0 +1,111 @@
+import os
+import json
+import sqlite3
+import threading
+import time
+from typing import List, Dict, Optional
+from config import *
+
+class SearchCache:
+    def __init__(self, path: str = CACHE_PATH, ttl: float = CACHE_TTL,
+                 max_entries: int = CACHE_MAX_ENTRIES):
+        if path != ':memory:' and not os.path.isabs(path):
+            path = os.path.join(os.path.dirname(os.path.abspath(__file__)), path)
+        
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS search_cache (
+                query TEXT PRIMARY KEY,
+                results TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_search_cache_accessed ON search_cache (accessed_at)"
+        )
+        self._conn.commit()
+        
+    def get(self, key: str) -> Optional[List[Dict]]:
+        now = time.time()
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT results, created_at FROM search_cache WHERE query = ?", (key,)
+            ).fetchone()
+            
+            if row is None:
+                self.misses += 1
+                return None
+            
+            if self.ttl and now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM search_cache WHERE query = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+            
+            self._conn.execute(
+                "UPDATE search_cache SET accessed_at = ? WHERE query = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            
+        return json.loads(row[0])
+    
+    def put(self, key: str, results: List[Dict]):
+        now = time.time()
+        
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (query, results, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(results), now, now)
+            )
+            
+            if self.max_entries:
+                self._conn.execute("""
+                    DELETE FROM search_cache WHERE query IN (
+                        SELECT query FROM search_cache
+                        ORDER BY accessed_at DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                """, (self.max_entries,))
+            
+            self._conn.commit()
+    
+    def purge_expired(self) -> int:
+        if not self.ttl:
+            return 0
+        
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM search_cache WHERE created_at < ?", (time.time() - self.ttl,)
+            )
+            self._conn.commit()
+            return cursor.rowcount
+    
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM search_cache")
+            self._conn.commit()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+    
+    def get_stats(self) -> Dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self)
+        }
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
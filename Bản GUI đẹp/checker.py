@@ -1,115 +1,548 @@
+import sys
 import time
-from typing import Dict, List, Callable, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Callable, Optional, Iterator, Tuple
 from collections import defaultdict
 from urllib.parse import urlparse
-from api import GoogleSearchAPI
-from analyzer import TextAnalyzer
+from health import ConnectionHealth
+from metrics import Metrics
+from backends import SearchBackend, create_backend
+from analyzer import TextAnalyzer, clean_text
+from results import SentenceResult
+from checkpoint import CheckpointStore, CheckpointJournal
 from config import *
 
+def resolve_sentence(report: Dict, result: Dict) -> str:
+    if 'sentence' in result:
+        return result['sentence']
+    
+    span = result.get('span')
+    if not span:
+        return ''
+    
+    start, end = span
+    return clean_text(report['metadata']['original_text'][start:end])
+
+class ReportAggregator:
+    def __init__(self, total_sentences: int, extract_domain: Callable[[str], str]):
+        self.total_sentences = total_sentences
+        self.extract_domain = extract_domain
+        self.completed = 0
+        self.error_count = 0
+        self.analyzed_count = 0
+        self.plagiarized_count = 0
+        self.high_risk_count = 0
+        self.medium_risk_count = 0
+        self.high_similarity_count = 0
+        self.similarity_total = 0.0
+        self.max_similarity = 0.0
+        self.risk_total = 0
+        self.domain_counts = defaultdict(int)
+        self.domain_first_seen = {}
+        self.source_details = defaultdict(list)
+        self.confidence_counts = defaultdict(int)
+        self.confidence_first_seen = {}
+    
+    def add(self, result: Dict, index: Optional[int] = None):
+        if index is None:
+            index = self.completed
+        self.completed += 1
+        
+        if 'error' in result:
+            self.error_count += 1
+            return
+        
+        similarity = result['similarity']
+        risk_score = result['risk_score']
+        
+        self.analyzed_count += 1
+        self.similarity_total += similarity
+        self.max_similarity = max(self.max_similarity, similarity)
+        self.risk_total += risk_score
+        confidence = result['confidence_level']
+        self.confidence_counts[confidence] += 1
+        self.confidence_first_seen[confidence] = min(index, self.confidence_first_seen.get(confidence, index))
+        
+        if risk_score >= 70:
+            self.high_risk_count += 1
+        elif risk_score >= 50:
+            self.medium_risk_count += 1
+        
+        if similarity > 0.8:
+            self.high_similarity_count += 1
+        
+        if result['is_plagiarism']:
+            self.plagiarized_count += 1
+            if result['source']:
+                domain = self.extract_domain(result['source'])
+                self.domain_counts[domain] += 1
+                self.domain_first_seen[domain] = min(index, self.domain_first_seen.get(domain, index))
+                self.source_details[domain].append((index, {
+                    'title': result['source_title'],
+                    'url': result['source'],
+                    'similarity': similarity,
+                    'sentence': result['sentence'][:100] + '...'
+                }))
+    
+    @property
+    def plagiarism_percentage(self) -> float:
+        return (self.plagiarized_count / self.completed) * 100 if self.completed else 0.0
+    
+    @property
+    def overall_score(self) -> int:
+        if not self.analyzed_count:
+            return 100
+        return max(0, 100 - int(self.risk_total / self.analyzed_count))
+    
+    def top_domains(self, limit: int = 5) -> List[Tuple[str, int]]:
+        ordered = sorted(self.domain_counts.items(), key=lambda x: (-x[1], self.domain_first_seen[x[0]]))
+        return ordered[:limit]
+    
+    def summary(self) -> Dict:
+        average = self.similarity_total / self.analyzed_count * 100 if self.analyzed_count else 0.0
+        
+        return {
+            'total_sentences': self.total_sentences,
+            'analyzed_sentences': self.analyzed_count,
+            'error_count': self.error_count,
+            'plagiarized_sentences': self.plagiarized_count,
+            'high_risk_sentences': self.high_risk_count,
+            'medium_risk_sentences': self.medium_risk_count,
+            'plagiarism_percentage': round(self.plagiarism_percentage, 2),
+            'average_similarity': round(average, 2),
+            'maximum_similarity': round(self.max_similarity * 100, 2)
+        }
+    
+    def snapshot(self) -> Dict:
+        snapshot = self.summary()
+        snapshot['overall_score'] = self.overall_score
+        snapshot['completed'] = self.completed
+        snapshot['top_domains'] = self.top_domains()
+        return snapshot
+    
+    def source_analysis(self) -> Dict:
+        top_sources = self.top_domains()
+        source_details = {
+            domain: [entry for _, entry in sorted(self.source_details[domain], key=lambda item: item[0])]
+            for domain, _ in sorted(self.domain_first_seen.items(), key=lambda item: item[1])
+        }
+        
+        return {
+            'total_unique_sources': len(self.domain_counts),
+            'top_sources': top_sources,
+            'source_details': source_details,
+            'most_problematic_domain': top_sources[0][0] if top_sources else None
+        }
+    
+    def confidence_distribution(self) -> Dict:
+        return {
+            confidence: self.confidence_counts[confidence]
+            for confidence, _ in sorted(self.confidence_first_seen.items(), key=lambda item: item[1])
+        }
+
 class PlagiarismChecker:
-    def __init__(self):
-        self.api = GoogleSearchAPI()
+    def __init__(self, backend: Optional[SearchBackend] = None, profile: bool = PROFILE_CHECKS,
+                 include_sentence_text: bool = REPORT_INCLUDE_SENTENCE_TEXT,
+                 checkpoints: Optional[CheckpointStore] = None):
+        self.api = backend if backend is not None else create_backend()
+        self.profile = profile
+        self.include_sentence_text = include_sentence_text
+        self.checkpoints = checkpoints if checkpoints is not None else (
+            CheckpointStore() if CHECKPOINT_ENABLED else None
+        )
+        self.metrics = Metrics()
         self.analyzer = TextAnalyzer()
         self.last_check_time = None
-        
+        self._throttle_baseline = 0.0
+        self._retry_baseline = 0
+        self._trip_baseline = 0
+        self._cache_hit_baseline = 0
+        self._cache_miss_baseline = 0
+        self.health = ConnectionHealth()
+        self._probe_lock = threading.Lock()
+        self._probe_thread = None
+    
     def test_connection(self) -> bool:
+        if not self.health.is_stale():
+            return self.health.get_status() != 'unhealthy'
+        return self._probe_connection()
+    
+    def get_health(self) -> Dict:
+        return self.health.snapshot()
+    
+    def refresh_health_async(self, callback: Optional[Callable] = None, force: bool = False) -> bool:
+        if not force and not self.health.is_stale():
+            if callback:
+                callback(self.health.snapshot())
+            return False
+        
+        with self._probe_lock:
+            if self._probe_thread is not None and self._probe_thread.is_alive():
+                return False
+            
+            def probe():
+                self._probe_connection()
+                if callback:
+                    callback(self.health.snapshot())
+            
+            self._probe_thread = threading.Thread(target=probe, daemon=True)
+            self._probe_thread.start()
+            return True
+    
+    def _probe_connection(self) -> bool:
         try:
-            return self.api.test_connection()
+            status = self.api.probe()
         except Exception:
-            return False
+            status = 'unhealthy'
+        
+        if status == 'healthy':
+            self.health.record_success()
+        elif status == 'reachable':
+            self.health.record_reachable()
+        else:
+            self.health.record_failure("Connection probe failed")
+        return status != 'unhealthy'
     
-    def check_text(self, text: str, progress_callback: Optional[Callable] = None) -> Dict:
-        self.last_check_time = time.time()
+    def check_text(self, text: str, progress_callback: Optional[Callable] = None,
+                   max_workers: int = MAX_CONCURRENT_SEARCHES) -> Dict:
+        report = None
+        
+        for event in self.check_text_stream(text, max_workers):
+            if event['type'] == 'sentence':
+                if progress_callback:
+                    progress_callback(event['completed'], event['total'], event['result']['sentence'])
+            else:
+                report = event['report']
+        
+        return report
+    
+    def check_text_stream(self, text: str, max_workers: int = MAX_CONCURRENT_SEARCHES) -> Iterator[Dict]:
+        self._start_check()
         
         if not text or len(text.strip()) < 10:
-            return self._generate_empty_report("Text too short")
+            yield {'type': 'report', 'report': self._finish_report(self._generate_empty_report("Text too short"))}
+            return
         
         try:
-            sentences = self.analyzer.extract_sentences(text)
-            
-            if not sentences:
-                return self._generate_empty_report("No valid sentences found")
+            with self.metrics.stage('extract_sentences'):
+                sentences = self.metrics.call(self._extract_sentences, text)
+        except Exception as e:
+            yield {'type': 'report', 'report': self._finish_report(self._generate_error_report(str(e)))}
+            return
+        
+        if not sentences:
+            yield {'type': 'report', 'report': self._finish_report(self._generate_empty_report("No valid sentences found"))}
+            return
+        
+        total_sentences = len(sentences)
+        results = [None] * total_sentences
+        aggregator = ReportAggregator(total_sentences, self._extract_domain)
+        journal = self._open_journal(text, total_sentences)
+        restored = dict(journal.completed) if journal is not None else {}
+        executor = ThreadPoolExecutor(max_workers=self._worker_count(max_workers))
+        futures = {}
+        
+        if restored:
+            self.metrics.increment('sentences_resumed', len(restored))
+        
+        try:
+            for completed, i in enumerate(sorted(restored), 1):
+                results[i] = restored[i]
+                aggregator.add(results[i], i)
+                
+                yield {
+                    'type': 'sentence',
+                    'index': i,
+                    'completed': completed,
+                    'total': total_sentences,
+                    'result': results[i],
+                    'stats': aggregator.snapshot(),
+                    'resumed': True
+                }
             
-            results = []
-            total_sentences = len(sentences)
+            futures = {
+                executor.submit(self.metrics.call, self._check_sentence, sentence, span): i
+                for i, (sentence, span) in enumerate(sentences)
+                if i not in restored
+            }
             
-            for i, sentence in enumerate(sentences):
-                if progress_callback:
-                    progress_callback(i + 1, total_sentences, sentence)
+            for completed, future in enumerate(as_completed(futures), len(restored) + 1):
+                i = futures[future]
+                results[i] = future.result()
+                aggregator.add(results[i], i)
+                if journal is not None:
+                    journal.record(i, results[i])
                 
+                yield {
+                    'type': 'sentence',
+                    'index': i,
+                    'completed': completed,
+                    'total': total_sentences,
+                    'result': results[i],
+                    'stats': aggregator.snapshot(),
+                    'resumed': False
+                }
+            
+            if journal is not None and journal.is_complete():
+                journal.discard()
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+            if journal is not None:
+                journal.close()
+        
+        try:
+            with self.metrics.stage('report'):
+                report = self.metrics.call(self._generate_comprehensive_report, results, text, aggregator)
+        except Exception as e:
+            report = self._generate_error_report(str(e))
+        
+        yield {'type': 'report', 'report': self._finish_report(report)}
+    
+    def check_documents(self, documents: Dict[str, str], progress_callback: Optional[Callable] = None,
+                        max_workers: int = MAX_CONCURRENT_SEARCHES) -> Dict:
+        self._start_check(len(documents))
+        
+        document_sentences = {}
+        extraction_errors = {}
+        unique_queries = {}
+        total_sentences = 0
+        
+        for name, text in documents.items():
+            sentences = []
+            if text and len(text.strip()) >= 10:
                 try:
-                    search_results = self.api.search(sentence)
-                    analysis = self.analyzer.analyze_sentence(sentence, search_results)
-                    results.append(analysis)
-                    
+                    with self.metrics.stage('extract_sentences'):
+                        sentences = self.metrics.call(self._extract_sentences, text)
                 except Exception as e:
-                    error_result = {
-                        'sentence': sentence,
-                        'similarity': 0.0,
-                        'source': None,
-                        'source_title': '',
-                        'source_domain': '',
-                        'matched_text': '',
-                        'is_plagiarism': False,
-                        'confidence_level': 'error',
-                        'risk_score': 0,
-                        'error': str(e)
-                    }
-                    results.append(error_result)
+                    extraction_errors[name] = str(e)
             
-            return self._generate_comprehensive_report(results, text)
+            keyed = []
+            for sentence, span in sentences:
+                key = self.api.normalize_query(sentence)
+                unique_queries.setdefault(key, sentence)
+                keyed.append((sentence, span, key))
             
-        except Exception as e:
-            return self._generate_error_report(str(e))
+            document_sentences[name] = keyed
+            total_sentences += len(keyed)
+        
+        search_results = {}
+        with ThreadPoolExecutor(max_workers=self._worker_count(max_workers)) as executor:
+            futures = {
+                executor.submit(self.metrics.call, self._search_sentence, sentence): key
+                for key, sentence in unique_queries.items()
+            }
+            
+            for completed, future in enumerate(as_completed(futures), 1):
+                key = futures[future]
+                search_results[key] = future.result()
+                
+                if progress_callback:
+                    progress_callback(completed, len(futures), unique_queries[key])
+        
+        pending = [
+            (sentence, search_results[key])
+            for keyed in document_sentences.values()
+            for sentence, _, key in keyed
+            if not isinstance(search_results[key], Exception)
+        ]
+        analyses = iter(self._analyze_sentences(pending))
+        
+        reports = {}
+        risk_distribution = defaultdict(int)
+        
+        for name, keyed in document_sentences.items():
+            text = documents[name]
+            
+            if name in extraction_errors:
+                reports[name] = self._generate_error_report(extraction_errors[name])
+            elif not keyed:
+                reason = "Text too short" if not text or len(text.strip()) < 10 else "No valid sentences found"
+                reports[name] = self._generate_empty_report(reason)
+            else:
+                results = []
+                for sentence, span, key in keyed:
+                    outcome = search_results[key]
+                    if isinstance(outcome, Exception):
+                        result = self._error_result(sentence, outcome)
+                    else:
+                        result = next(analyses)
+                    result['span'] = span
+                    results.append(result)
+                with self.metrics.stage('report'):
+                    reports[name] = self.metrics.call(self._generate_comprehensive_report, results, text)
+            
+            risk_distribution[reports[name]['summary']['risk_level']] += 1
+        
+        processing_time = time.time() - self.last_check_time
+        
+        return {
+            'summary': {
+                'total_documents': len(documents),
+                'total_sentences': total_sentences,
+                'unique_queries': len(unique_queries),
+                'searches_saved': total_sentences - len(unique_queries),
+                'risk_distribution': dict(risk_distribution),
+                'api_requests_used': self.api.get_requests_made(),
+                'api_requests_remaining': self.api.get_remaining_requests(),
+                'cache_hits': self.api.get_cache_hits() - self._cache_hit_baseline,
+                'cache_misses': self.api.get_cache_misses() - self._cache_miss_baseline,
+                'retries': self.api.get_retry_count() - self._retry_baseline,
+                'circuit_breaker_trips': self.api.get_circuit_trips() - self._trip_baseline,
+                'processing_time': round(processing_time, 2)
+            },
+            'performance': self._publish_metrics(),
+            'reports': reports
+        }
     
-    def _generate_comprehensive_report(self, results: List[Dict], original_text: str) -> Dict:
-        total_sentences = len(results)
-        valid_results = [r for r in results if 'error' not in r]
-        error_count = total_sentences - len(valid_results)
+    def _start_check(self, documents: int = 1):
+        self.last_check_time = time.time()
+        self._throttle_baseline = self.api.get_throttle_time()
+        self._retry_baseline = self.api.get_retry_count()
+        self._trip_baseline = self.api.get_circuit_trips()
+        self._cache_hit_baseline = self.api.get_cache_hits()
+        self._cache_miss_baseline = self.api.get_cache_misses()
+        self.api.start_retry_budget(documents)
+        self.metrics = Metrics(profile=self.profile)
+    
+    def _publish_metrics(self) -> Dict:
+        self.metrics.add_time('rate_limit_wait', self.api.get_throttle_time() - self._throttle_baseline)
+        return self.metrics.publish()
+    
+    def _finish_report(self, report: Dict) -> Dict:
+        report['performance'] = self._publish_metrics()
+        return report
+    
+    def _worker_count(self, max_workers: int) -> int:
+        workers = 1 if self.profile else max(1, max_workers)
+        info = {'requested': max_workers, 'used': workers}
+        if workers < max_workers:
+            info['reason'] = 'profiling runs searches on a single worker'
+        self.metrics.set_info('workers', info)
+        return workers
+    
+    def _open_journal(self, text: str, total_sentences: int) -> Optional[CheckpointJournal]:
+        if self.checkpoints is None:
+            return None
         
-        if not valid_results:
-            return self._generate_empty_report("No valid analysis results")
+        fingerprint = (f"{self.api.name}|{self.analyzer.similarity_threshold}|"
+                       f"{self.analyzer.sequence_engine}|{self.analyzer.weights}")
+        try:
+            return self.checkpoints.open(text, total_sentences, fingerprint)
+        except OSError as e:
+            print(f"⚠️ Checkpoint journal unavailable: {e}", file=sys.stderr)
+            return None
+    
+    def _extract_sentences(self, text: str) -> List[Tuple[str, Tuple[int, int]]]:
+        return [(sentence, (start, end)) for sentence, start, end, _ in self.analyzer.iter_sentences(text)]
+    
+    def _check_sentence(self, sentence: str, span: Optional[Tuple[int, int]] = None) -> SentenceResult:
+        outcome = self._search_sentence(sentence)
+        if isinstance(outcome, Exception):
+            result = self._error_result(sentence, outcome)
+        else:
+            result = self._analyze_sentence(sentence, outcome)
+        result['span'] = span
+        return result
+    
+    def _search_sentence(self, sentence: str):
+        start = time.perf_counter()
+        try:
+            results = self.api.search(sentence)
+        except Exception as e:
+            self.health.record_failure(str(e))
+            self.metrics.increment('search_errors')
+            return e
+        finally:
+            elapsed = time.perf_counter() - start
+            self.metrics.add_time('search', elapsed)
+            self.metrics.observe('search_latency', elapsed)
+            self.metrics.increment('searches')
         
-        plagiarized_sentences = [r for r in valid_results if r['is_plagiarism']]
-        high_risk_sentences = [r for r in valid_results if r['risk_score'] >= 70]
-        medium_risk_sentences = [r for r in valid_results if 50 <= r['risk_score'] < 70]
+        self.health.record_success()
+        return results
+    
+    def _analyze_sentence(self, sentence: str, search_results: List[Dict]) -> SentenceResult:
+        start = time.perf_counter()
+        try:
+            return self.analyzer.analyze_sentence(sentence, search_results)
+        except Exception as e:
+            return self._error_result(sentence, e)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.metrics.add_time('scoring', elapsed)
+            self.metrics.increment('sentences_scored')
+            if search_results:
+                self.metrics.increment('pairs_scored', len(search_results))
+                self.metrics.observe('pair_scoring', elapsed / len(search_results))
+    
+    def _analyze_sentences(self, items: List[Tuple[str, List[Dict]]]) -> List[SentenceResult]:
+        if self.analyzer.scoring_mode != 'process':
+            return [self.metrics.call(self._analyze_sentence, sentence, search_results)
+                    for sentence, search_results in items]
         
-        plagiarism_percentage = (len(plagiarized_sentences) / total_sentences) * 100
-        avg_similarity = sum(r['similarity'] for r in valid_results) / len(valid_results) * 100
-        max_similarity = max((r['similarity'] for r in valid_results), default=0) * 100
+        start = time.perf_counter()
+        try:
+            return self.analyzer.analyze_sentences(items)
+        except Exception as e:
+            return [self._error_result(sentence, e) for sentence, _ in items]
+        finally:
+            elapsed = time.perf_counter() - start
+            pairs = sum(len(search_results) for _, search_results in items)
+            self.metrics.add_time('scoring', elapsed)
+            self.metrics.increment('sentences_scored', len(items))
+            if pairs:
+                self.metrics.increment('pairs_scored', pairs)
+                self.metrics.observe('pair_scoring', elapsed / pairs)
+    
+    def _error_result(self, sentence: str, error: Exception) -> SentenceResult:
+        return SentenceResult(sentence, confidence_level='error', error=str(error))
+    
+    def _generate_comprehensive_report(self, results: List[Dict], original_text: str,
+                                       aggregator: Optional[ReportAggregator] = None) -> Dict:
+        if aggregator is None:
+            aggregator = ReportAggregator(len(results), self._extract_domain)
+            for index, result in enumerate(results):
+                aggregator.add(result, index)
         
-        risk_level = self._determine_risk_level(plagiarism_percentage)
-        overall_score = self._calculate_overall_score(valid_results)
+        if not aggregator.analyzed_count:
+            report = self._generate_empty_report("No valid analysis results")
+            report['summary']['total_sentences'] = aggregator.completed
+            report['summary']['error_count'] = aggregator.error_count
+            return report
         
-        source_analysis = self._analyze_sources(plagiarized_sentences)
-        confidence_distribution = self._analyze_confidence_distribution(valid_results)
+        valid_results = [r for r in results if 'error' not in r]
+        risk_level = self._determine_risk_level(aggregator.plagiarism_percentage)
+        source_analysis = aggregator.source_analysis()
         
         recommendations = self._generate_smart_recommendations(
-            plagiarism_percentage, risk_level, source_analysis, valid_results
+            aggregator.plagiarism_percentage, risk_level, source_analysis, aggregator.high_similarity_count
         )
         
         processing_time = time.time() - self.last_check_time if self.last_check_time else 0
+        rate_limit_wait = self.api.get_throttle_time() - self._throttle_baseline
         
         return {
             'summary': {
-                'total_sentences': total_sentences,
-                'analyzed_sentences': len(valid_results),
-                'error_count': error_count,
-                'plagiarized_sentences': len(plagiarized_sentences),
-                'high_risk_sentences': len(high_risk_sentences),
-                'medium_risk_sentences': len(medium_risk_sentences),
-                'plagiarism_percentage': round(plagiarism_percentage, 2),
-                'average_similarity': round(avg_similarity, 2),
-                'maximum_similarity': round(max_similarity, 2),
+                **aggregator.summary(),
                 'risk_level': risk_level,
-                'overall_score': overall_score,
+                'overall_score': aggregator.overall_score,
                 'api_requests_used': self.api.get_requests_made(),
                 'api_requests_remaining': self.api.get_remaining_requests(),
+                'cache_hits': self.api.get_cache_hits() - self._cache_hit_baseline,
+                'cache_misses': self.api.get_cache_misses() - self._cache_miss_baseline,
+                'rate_limit_wait_time': round(rate_limit_wait, 2),
+                'retries': self.api.get_retry_count() - self._retry_baseline,
+                'circuit_breaker_trips': self.api.get_circuit_trips() - self._trip_baseline,
                 'processing_time': round(processing_time, 2)
             },
-            'detailed_results': valid_results,
+            'detailed_results': valid_results if self.include_sentence_text else [
+                result.without_sentence() for result in valid_results
+            ],
             'source_analysis': source_analysis,
-            'confidence_distribution': confidence_distribution,
+            'confidence_distribution': aggregator.confidence_distribution(),
             'recommendations': recommendations,
             'metadata': {
                 'original_text': original_text,
@@ -117,6 +550,7 @@ class PlagiarismChecker:
                 'word_count': len(original_text.split()),
                 'character_count': len(original_text.replace(' ', '')),
                 'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'search_backend': self.api.name,
                 'checker_version': '2.0'
             }
         }
@@ -133,49 +567,8 @@ class PlagiarismChecker:
         else:
             return 'SAFE'
     
-    def _calculate_overall_score(self, results: List[Dict]) -> int:
-        if not results:
-            return 0
-        
-        total_risk = sum(r['risk_score'] for r in results)
-        avg_risk = total_risk / len(results)
-        overall_score = max(0, 100 - int(avg_risk))
-        
-        return overall_score
-    
-    def _analyze_sources(self, plagiarized_results: List[Dict]) -> Dict:
-        domain_count = defaultdict(int)
-        source_details = defaultdict(list)
-        
-        for result in plagiarized_results:
-            if result['source']:
-                domain = self._extract_domain(result['source'])
-                domain_count[domain] += 1
-                source_details[domain].append({
-                    'title': result['source_title'],
-                    'url': result['source'],
-                    'similarity': result['similarity'],
-                    'sentence': result['sentence'][:100] + '...'
-                })
-        
-        top_sources = sorted(domain_count.items(), key=lambda x: x[1], reverse=True)[:5]
-        
-        return {
-            'total_unique_sources': len(domain_count),
-            'top_sources': top_sources,
-            'source_details': dict(source_details),
-            'most_problematic_domain': top_sources[0][0] if top_sources else None
-        }
-    
-    def _analyze_confidence_distribution(self, results: List[Dict]) -> Dict:
-        confidence_counts = defaultdict(int)
-        for result in results:
-            confidence_counts[result['confidence_level']] += 1
-        
-        return dict(confidence_counts)
-    
     def _generate_smart_recommendations(self, percentage: float, risk_level: str, 
-                                      source_analysis: Dict, results: List[Dict]) -> List[str]:
+                                      source_analysis: Dict, high_similarity_count: int) -> List[str]:
         recommendations = []
         
         if risk_level == 'CRITICAL':
@@ -215,7 +608,6 @@ class PlagiarismChecker:
         if source_analysis['total_unique_sources'] > 3:
             recommendations.append(f"📊 Multiple sources detected ({source_analysis['total_unique_sources']}) - ensure proper attribution")
         
-        high_similarity_count = len([r for r in results if r['similarity'] > 0.8])
         if high_similarity_count > 0:
             recommendations.append(f"🎯 {high_similarity_count} sentences need immediate attention (>80% similarity)")
         
@@ -227,7 +619,7 @@ class PlagiarismChecker:
             domain = parsed.netloc
             if domain.startswith('www.'):
                 domain = domain[4:]
-            return domain
+            return domain or url
         except Exception:
             return url
     
@@ -247,6 +639,11 @@ class PlagiarismChecker:
                 'overall_score': 100,
                 'api_requests_used': self.api.get_requests_made(),
                 'api_requests_remaining': self.api.get_remaining_requests(),
+                'cache_hits': self.api.get_cache_hits() - self._cache_hit_baseline,
+                'cache_misses': self.api.get_cache_misses() - self._cache_miss_baseline,
+                'rate_limit_wait_time': 0.0,
+                'retries': self.api.get_retry_count() - self._retry_baseline,
+                'circuit_breaker_trips': self.api.get_circuit_trips() - self._trip_baseline,
                 'processing_time': 0.0
             },
             'detailed_results': [],
@@ -264,6 +661,7 @@ class PlagiarismChecker:
                 'word_count': 0,
                 'character_count': 0,
                 'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'search_backend': self.api.name,
                 'checker_version': '2.0'
             }
         }
@@ -0,0 +1,190 @@
+import os
+import json
+import sys
+import time
+import hashlib
+import threading
+from typing import Dict, Optional
+from results import SentenceResult, to_jsonable
+from config import *
+
+JOURNAL_VERSION = 1
+
+class CheckpointJournal:
+    def __init__(self, path: str, total_sentences: int, fsync: bool = CHECKPOINT_FSYNC):
+        self.path = path
+        self.total_sentences = total_sentences
+        self.fsync = fsync
+        self.completed = {}
+        self._file = None
+        self._lock = threading.Lock()
+    
+    def load(self) -> Dict[int, SentenceResult]:
+        with self._lock:
+            lines = 0
+            valid_header = False
+            
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8', errors='replace') as file:
+                    for lines, line in enumerate(file, 1):
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            continue
+                        
+                        if lines == 1:
+                            valid_header = (isinstance(record, dict) and
+                                            record.get('version') == JOURNAL_VERSION and
+                                            record.get('sentences') == self.total_sentences)
+                            if not valid_header:
+                                break
+                            continue
+                        
+                        try:
+                            result = SentenceResult.from_dict(record['result'])
+                            index = int(record['index'])
+                        except (KeyError, TypeError, ValueError):
+                            continue
+                        
+                        if 0 <= index < self.total_sentences:
+                            if result.span is not None:
+                                result.span = tuple(result.span)
+                            self.completed[index] = result
+            
+            if not valid_header:
+                self.completed = {}
+            
+            if not valid_header or lines != len(self.completed) + 1:
+                self._rewrite()
+            
+            self._file = open(self.path, 'a', encoding='utf-8')
+            return dict(self.completed)
+    
+    def record(self, index: int, result: SentenceResult):
+        if 'error' in result:
+            return
+        
+        line = json.dumps({'index': index, 'result': result}, ensure_ascii=False, default=to_jsonable)
+        
+        with self._lock:
+            self.completed[index] = result
+            if self._file is None:
+                return
+            
+            try:
+                self._file.write(line + '\n')
+                self._file.flush()
+                if self.fsync:
+                    os.fsync(self._file.fileno())
+            except OSError as e:
+                print(f"⚠️ Checkpoint write failed, journaling disabled: {e}", file=sys.stderr)
+                self._file.close()
+                self._file = None
+    
+    def _rewrite(self):
+        temp_path = self.path + '.tmp'
+        
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            header = {'version': JOURNAL_VERSION, 'sentences': self.total_sentences, 'created_at': time.time()}
+            file.write(json.dumps(header) + '\n')
+            for index in sorted(self.completed):
+                record = {'index': index, 'result': self.completed[index]}
+                file.write(json.dumps(record, ensure_ascii=False, default=to_jsonable) + '\n')
+            file.flush()
+            if self.fsync:
+                os.fsync(file.fileno())
+        
+        os.replace(temp_path, self.path)
+    
+    def is_complete(self) -> bool:
+        return len(self.completed) >= self.total_sentences
+    
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+    
+    def discard(self):
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+class CheckpointStore:
+    def __init__(self, directory: str = CHECKPOINT_DIR, ttl: float = CHECKPOINT_TTL,
+                 max_files: int = CHECKPOINT_MAX_FILES, fsync: bool = CHECKPOINT_FSYNC):
+        if not os.path.isabs(directory):
+            directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), directory)
+        
+        self.directory = directory
+        self.ttl = ttl
+        self.max_files = max_files
+        self.fsync = fsync
+        self.resumed = 0
+    
+    def document_key(self, text: str, fingerprint: str = '') -> str:
+        digest = hashlib.sha256()
+        digest.update(fingerprint.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(text.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def open(self, text: str, total_sentences: int, fingerprint: str = '') -> CheckpointJournal:
+        os.makedirs(self.directory, exist_ok=True)
+        
+        path = os.path.join(self.directory, self.document_key(text, fingerprint) + '.jsonl')
+        self.cleanup(keep=path)
+        
+        journal = CheckpointJournal(path, total_sentences, self.fsync)
+        self.resumed += len(journal.load())
+        return journal
+    
+    def _journal_files(self):
+        if not os.path.isdir(self.directory):
+            return []
+        
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.jsonl'):
+                path = os.path.join(self.directory, name)
+                try:
+                    files.append((os.path.getmtime(path), path))
+                except OSError:
+                    continue
+        return sorted(files, reverse=True)
+    
+    def cleanup(self, keep: Optional[str] = None) -> int:
+        now = time.time()
+        removed = 0
+        position = 1 if keep else 0
+        
+        for modified, path in self._journal_files():
+            expired = self.ttl and now - modified > self.ttl
+            if path != keep:
+                position += 1
+            
+            if expired or (path != keep and self.max_files and position > self.max_files):
+                try:
+                    os.remove(path)
+                    removed += 1
+                except OSError:
+                    continue
+        
+        return removed
+    
+    def clear(self) -> int:
+        removed = 0
+        for _, path in self._journal_files():
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                continue
+        return removed
+    
+    def get_stats(self) -> Dict:
+        return {
+            'directory': self.directory,
+            'journals': len(self._journal_files()),
+            'resumed_sentences': self.resumed
+        }
@@ -0,0 +1,193 @@
+import os
+import sys
+import json
+import argparse
+from typing import Dict, List
+from results import report_to_dict
+from config import *
+
+RISK_EXIT_CODES = {
+    'SAFE': 0,
+    'LOW': 3,
+    'MEDIUM': 4,
+    'HIGH': 5,
+    'CRITICAL': 6
+}
+EXIT_FAILURE = 1
+
+def collect_documents(paths: List[str]) -> Dict[str, str]:
+    documents = {}
+    
+    for path in paths:
+        if path == '-':
+            documents['<stdin>'] = sys.stdin.read()
+        elif os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for file_name in sorted(files):
+                    if file_name.lower().endswith(CORPUS_EXTENSIONS):
+                        file_path = os.path.join(root, file_name)
+                        documents[file_path] = _read_file(file_path)
+        else:
+            documents[path] = _read_file(path)
+    
+    return documents
+
+def _read_file(path: str) -> str:
+    with open(path, 'r', encoding='utf-8', errors='ignore') as file:
+        return file.read()
+
+def emit(record: Dict):
+    sys.stdout.write(json.dumps(report_to_dict(record), ensure_ascii=False) + '\n')
+    sys.stdout.flush()
+
+def document_record(name: str, report: Dict) -> Dict:
+    return {
+        'type': 'document',
+        'document': name,
+        'summary': report['summary'],
+        'source_analysis': report['source_analysis'],
+        'confidence_distribution': report['confidence_distribution'],
+        'recommendations': report['recommendations'],
+        'performance': report.get('performance')
+    }
+
+def exit_code_for(reports: List[Dict]) -> int:
+    code = 0
+    for report in reports:
+        summary = report['summary']
+        if not summary['analyzed_sentences'] and (summary['error_count'] or summary['total_sentences']):
+            return EXIT_FAILURE
+        code = max(code, RISK_EXIT_CODES.get(summary['risk_level'], 0))
+    return code
+
+def run_check(args) -> int:
+    from backends import create_backend
+    from checker import PlagiarismChecker
+    
+    documents = collect_documents(args.paths or ['-'])
+    if not documents:
+        print("❌ No documents found", file=sys.stderr)
+        return EXIT_FAILURE
+    
+    checker = PlagiarismChecker(create_backend(args.backend), profile=args.profile)
+    if args.no_resume:
+        checker.checkpoints = None
+    reports = []
+    
+    for name, text in documents.items():
+        for event in checker.check_text_stream(text, max_workers=args.workers):
+            if event['type'] == 'sentence':
+                if not args.summary_only:
+                    emit({
+                        'type': 'sentence',
+                        'document': name,
+                        'index': event['index'],
+                        'result': event['result'],
+                        'resumed': event['resumed']
+                    })
+            else:
+                reports.append(event['report'])
+                emit(document_record(name, event['report']))
+    
+    return exit_code_for(reports)
+
+def run_batch(args) -> int:
+    from backends import create_backend
+    from checker import PlagiarismChecker
+    
+    documents = collect_documents(args.paths)
+    if not documents:
+        print("❌ No documents found", file=sys.stderr)
+        return EXIT_FAILURE
+    
+    checker = PlagiarismChecker(create_backend(args.backend), profile=args.profile)
+    
+    def progress_callback(current, total, sentence):
+        print(f"\r🔍 Searching {current}/{total} unique sentences...", end='', file=sys.stderr)
+    
+    result = checker.check_documents(
+        documents,
+        progress_callback=None if args.quiet else progress_callback,
+        max_workers=args.workers
+    )
+    
+    if not args.quiet:
+        summary = result['summary']
+        print(f"\n✅ {summary['total_documents']} documents, {summary['total_sentences']} sentences, "
+              f"{summary['unique_queries']} searches ({summary['searches_saved']} saved)", file=sys.stderr)
+    
+    reports = list(result['reports'].values())
+    
+    if args.format == 'ndjson':
+        for name, report in result['reports'].items():
+            emit(document_record(name, report))
+        emit({'type': 'batch', 'summary': result['summary'], 'performance': result['performance']})
+        return exit_code_for(reports)
+    
+    output = json.dumps(report_to_dict(result), ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(output)
+    else:
+        print(output)
+    
+    return exit_code_for(reports)
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Plagiarism Checker Pro - headless command line interface",
+        epilog="Exit codes: 0 SAFE, 3 LOW, 4 MEDIUM, 5 HIGH, 6 CRITICAL (highest across documents), 1 failure"
+    )
+    subparsers = parser.add_subparsers(dest='command')
+    
+    check = subparsers.add_parser('check', help="Check documents one by one and stream NDJSON records")
+    check.add_argument('paths', nargs='*', help="Text files or directories of text files ('-' or none for stdin)")
+    check.add_argument('-w', '--workers', type=int, default=MAX_CONCURRENT_SEARCHES,
+                       help="Number of concurrent searches")
+    check.add_argument('-b', '--backend', default=SEARCH_BACKEND,
+                       choices=['google', 'local', 'chain', 'fake'], help="Search backend to use")
+    check.add_argument('-s', '--summary-only', action='store_true',
+                       help="Only emit one record per document")
+    check.add_argument('-p', '--profile', action='store_true',
+                       help="Include cProfile output in the performance section (runs searches on one worker)")
+    check.add_argument('--no-resume', action='store_true',
+                       help="Do not resume from or write checkpoint journals")
+    check.set_defaults(handler=run_check)
+    
+    batch = subparsers.add_parser('batch', help="Check many documents with shared, deduplicated searches")
+    batch.add_argument('paths', nargs='+', help="Text files or directories of text files")
+    batch.add_argument('-o', '--output', help="Write the JSON result to this file instead of stdout")
+    batch.add_argument('-w', '--workers', type=int, default=MAX_CONCURRENT_SEARCHES,
+                       help="Number of concurrent searches")
+    batch.add_argument('-b', '--backend', default=SEARCH_BACKEND,
+                       choices=['google', 'local', 'chain', 'fake'], help="Search backend to use")
+    batch.add_argument('-f', '--format', default='json', choices=['json', 'ndjson'],
+                       help="Output one JSON document or NDJSON records")
+    batch.add_argument('-q', '--quiet', action='store_true', help="Do not print progress to stderr")
+    batch.add_argument('-p', '--profile', action='store_true',
+                       help="Include cProfile output in the performance section (runs searches on one worker)")
+    batch.set_defaults(handler=run_batch)
+    
+    return parser
+
+def main(argv: List[str] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    
+    if not hasattr(args, 'handler'):
+        parser.print_help()
+        return EXIT_FAILURE
+    
+    try:
+        return args.handler(args)
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return EXIT_FAILURE
+    except Exception as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return EXIT_FAILURE
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+import sys
+import time
+import random
+from typing import List, Tuple, Dict
+from analyzer import TextAnalyzer
+from config import *
+
+SAMPLE_TEXT = """Artificial intelligence (AI) is intelligence demonstrated by machines, in contrast to the natural intelligence displayed by humans and animals. Leading AI textbooks define the field as the study of intelligent agents: any device that perceives its environment and takes actions that maximize its chance of successfully achieving its goals.
+
+Machine learning is a method of data analysis that automates analytical model building. It is a branch of artificial intelligence based on the idea that systems can learn from data, identify patterns and make decisions with minimal human intervention. Deep learning is part of a broader family of machine learning methods based on artificial neural networks with representation learning.
+
+Natural language processing (NLP) is a subfield of linguistics, computer science, and artificial intelligence concerned with the interactions between computers and human language, in particular how to program computers to process and analyze large amounts of natural language data."""
+
+ENGINES = ['difflib', 'lcs', 'token_lcs']
+
+def build_pairs(analyzer: TextAnalyzer, text: str, seed: int = 7) -> List[Tuple[str, str]]:
+    rng = random.Random(seed)
+    sentences = list(dict.fromkeys(analyzer.extract_sentences(text)))
+    vocabulary = text.split()
+    pairs = []
+    
+    for sentence in sentences:
+        words = sentence.split()
+        for rate in (0.0, 0.1, 0.25, 0.5, 0.75):
+            variant = [w if rng.random() >= rate else rng.choice(vocabulary) for w in words]
+            if rng.random() < 0.5:
+                variant = rng.sample(vocabulary, 4) + variant + rng.sample(vocabulary, 4)
+            pairs.append((sentence, ' '.join(variant)))
+        
+        for other in sentences:
+            if other != sentence:
+                pairs.append((sentence, other))
+    
+    return pairs
+
+def compare(pairs: List[Tuple[str, str]]) -> Dict:
+    analyzer = TextAnalyzer()
+    normalized = [(analyzer._normalize_text(a), analyzer._normalize_text(b)) for a, b in pairs]
+    report = {}
+    baseline = None
+    baseline_final = None
+    
+    for engine in ENGINES:
+        analyzer.sequence_engine = engine
+        
+        start = time.perf_counter()
+        scores = [analyzer._sequence_similarity(a, b) for a, b in normalized]
+        elapsed = time.perf_counter() - start
+        final = [analyzer.calculate_similarity(a, b) for a, b in pairs]
+        
+        if baseline is None:
+            baseline, baseline_final = scores, final
+        
+        errors = [abs(x - y) for x, y in zip(scores, baseline)]
+        agreement = sum(
+            1 for x, y in zip(final, baseline_final)
+            if (x > SIMILARITY_THRESHOLD) == (y > SIMILARITY_THRESHOLD)
+        )
+        
+        report[engine] = {
+            'mean_abs_error': sum(errors) / len(errors),
+            'max_abs_error': max(errors),
+            'correlation': _correlation(scores, baseline),
+            'decision_agreement': agreement / len(pairs),
+            'us_per_pair': elapsed / len(pairs) * 1e6
+        }
+    
+    return report
+
+def _correlation(xs: List[float], ys: List[float]) -> float:
+    n = len(xs)
+    mean_x, mean_y = sum(xs) / n, sum(ys) / n
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    var_y = sum((y - mean_y) ** 2 for y in ys)
+    if var_x == 0 or var_y == 0:
+        return 1.0 if xs == ys else 0.0
+    return cov / (var_x * var_y) ** 0.5
+
+def main():
+    text = SAMPLE_TEXT
+    if len(sys.argv) > 1:
+        parts = []
+        for path in sys.argv[1:]:
+            with open(path, 'r', encoding='utf-8') as file:
+                parts.append(file.read())
+        text = '\n\n'.join(parts)
+    
+    pairs = build_pairs(TextAnalyzer(), text)
+    if not pairs:
+        print("❌ No sentence pairs could be built from the input")
+        return 1
+    
+    print(f"📊 Sequence engine comparison against difflib ({len(pairs)} pairs)")
+    print("=" * 78)
+    print(f"{'engine':<12}{'mean err':>10}{'max err':>10}{'corr':>8}{'agree':>9}{'us/pair':>12}")
+    
+    for engine, stats in compare(pairs).items():
+        print(f"{engine:<12}{stats['mean_abs_error']:>10.4f}{stats['max_abs_error']:>10.4f}"
+              f"{stats['correlation']:>8.3f}{stats['decision_agreement']:>9.1%}{stats['us_per_pair']:>12.1f}")
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
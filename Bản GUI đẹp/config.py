@@ -4,10 +4,70 @@ BASE_URL = "https://www.googleapis.com/customsearch/v1"
 
 SIMILARITY_THRESHOLD = 0.65
 MAX_REQUESTS_PER_DAY = 100
-REQUEST_DELAY = 1.2
+REQUESTS_PER_SECOND = 1 / 1.2
+RATE_LIMIT_BURST = 1
 MIN_SENTENCE_WORDS = 6
 MAX_SENTENCE_WORDS = 25
 MAX_RESULTS_PER_SEARCH = 5
+REPORT_INCLUDE_SENTENCE_TEXT = False
+
+SCORING_MODE = 'pruned'
+SEQUENCE_ENGINE = 'difflib'
+LCS_CHECK_INTERVAL = 16
+CERTAIN_MATCH_THRESHOLD = 1.0
+PRUNING_MARGIN = 1e-9
+SCORING_WORKERS = 0
+SCORING_CHUNK_SIZE = 16
+SHARED_MEMORY_MIN_BYTES = 64 * 1024
+
+LSH_ENABLED = True
+LSH_MIN_CANDIDATES = 20
+LSH_BANDS = 16
+LSH_ROWS = 2
+LSH_SHINGLE_SIZE = 1
+LSH_SEED = 1
+LSH_CACHE_SIZE = 4096
+FEATURE_CACHE_SIZE = 4096
+MAX_CONCURRENT_SEARCHES = 4
+
+SEARCH_BACKEND = 'google'
+CHAIN_RESOLVE_THRESHOLD = 0.8
+HEALTH_WINDOW = 20
+HEALTH_STALE_AFTER = 300
+HEALTH_UNHEALTHY_ERROR_RATE = 0.5
+HEALTH_PROBE_TIMEOUT = 5
+
+HTTP_POOL_SIZE = 10
+HTTP_KEEPALIVE_TIMEOUT = 30
+HTTP_TIMEOUT = 20
+
+RETRY_MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_BUDGET_PER_DOCUMENT = 20
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 60
+
+PROFILE_CHECKS = False
+METRICS_MAX_SAMPLES = 10000
+METRICS_PROFILE_LINES = 25
+
+CACHE_ENABLED = True
+CACHE_PATH = 'search_cache.db'
+CACHE_TTL = 7 * 24 * 3600
+CACHE_MAX_ENTRIES = 10000
+
+CHECKPOINT_ENABLED = True
+CHECKPOINT_DIR = '.checkpoints'
+CHECKPOINT_TTL = 3 * 24 * 3600
+CHECKPOINT_MAX_FILES = 100
+CHECKPOINT_FSYNC = True
+
+CORPUS_INDEX_PATH = 'corpus_index.db'
+CORPUS_EXTENSIONS = ('.txt', '.md')
+CORPUS_SHINGLE_SIZE = 3
+CORPUS_PASSAGE_WORDS = 12
+CORPUS_MIN_SHARED_SHINGLES = 2
 
 RISK_LEVELS = {
     'CRITICAL': 40,
@@ -0,0 +1,237 @@
+import os
+import re
+import sys
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import List, Dict, Optional, Iterable
+from backends import SearchBackend
+from config import *
+
+class LocalCorpusSearch(SearchBackend):
+    name = 'local'
+    
+    def __init__(self, index_path: str = CORPUS_INDEX_PATH, shingle_size: int = CORPUS_SHINGLE_SIZE):
+        if index_path != ':memory:' and not os.path.isabs(index_path):
+            index_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), index_path)
+        
+        self.index_path = index_path
+        self.shingle_size = shingle_size
+        self.queries_served = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(index_path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY,
+                path TEXT UNIQUE NOT NULL,
+                title TEXT NOT NULL,
+                mtime REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS passages (
+                id INTEGER PRIMARY KEY,
+                document_id INTEGER NOT NULL,
+                text TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_passages_document ON passages (document_id);
+            CREATE TABLE IF NOT EXISTS postings (
+                shingle INTEGER NOT NULL,
+                passage_id INTEGER NOT NULL,
+                PRIMARY KEY (shingle, passage_id)
+            ) WITHOUT ROWID;
+        """)
+        self._conn.commit()
+        
+    def ingest_directory(self, directory: str, extensions: Iterable[str] = CORPUS_EXTENSIONS) -> int:
+        extensions = tuple(ext.lower() for ext in extensions)
+        ingested = 0
+        seen = set()
+        
+        for root, _, files in os.walk(directory):
+            for file_name in sorted(files):
+                if not file_name.lower().endswith(extensions):
+                    continue
+                
+                path = os.path.abspath(os.path.join(root, file_name))
+                seen.add(path)
+                mtime = os.path.getmtime(path)
+                
+                if self._is_current(path, mtime):
+                    continue
+                
+                try:
+                    with open(path, 'r', encoding='utf-8', errors='ignore') as file:
+                        text = file.read()
+                except OSError:
+                    continue
+                
+                self.add_document(path, text, mtime=mtime)
+                ingested += 1
+        
+        self._remove_missing(directory, seen)
+        return ingested
+    
+    def _remove_missing(self, directory: str, seen: set) -> int:
+        prefix = os.path.join(os.path.abspath(directory), '')
+        
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, path FROM documents WHERE substr(path, 1, ?) = ?", (len(prefix), prefix)
+            ).fetchall()
+            
+            missing = [document_id for document_id, path in rows if path not in seen]
+            for document_id in missing:
+                self._delete_document(document_id)
+            
+            self._conn.commit()
+        
+        return len(missing)
+    
+    def add_document(self, path: str, text: str, title: Optional[str] = None, mtime: float = 0.0):
+        if title is None:
+            first_line = text.strip().split('\n', 1)[0].strip()
+            title = first_line[:120] if first_line else Path(path).stem
+        
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM documents WHERE path = ?", (path,)).fetchone()
+            if row:
+                self._delete_document(row[0])
+            
+            cursor = self._conn.execute(
+                "INSERT INTO documents (path, title, mtime) VALUES (?, ?, ?)", (path, title, mtime)
+            )
+            document_id = cursor.lastrowid
+            
+            for passage in self._split_passages(text):
+                cursor = self._conn.execute(
+                    "INSERT INTO passages (document_id, text) VALUES (?, ?)", (document_id, passage)
+                )
+                passage_id = cursor.lastrowid
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO postings (shingle, passage_id) VALUES (?, ?)",
+                    ((shingle, passage_id) for shingle in self._shingles(passage))
+                )
+            
+            self._conn.commit()
+    
+    def _is_current(self, path: str, mtime: float) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT mtime FROM documents WHERE path = ?", (path,)).fetchone()
+        return row is not None and row[0] == mtime
+    
+    def _delete_document(self, document_id: int):
+        self._conn.execute("""
+            DELETE FROM postings WHERE passage_id IN (
+                SELECT id FROM passages WHERE document_id = ?
+            )
+        """, (document_id,))
+        self._conn.execute("DELETE FROM passages WHERE document_id = ?", (document_id,))
+        self._conn.execute("DELETE FROM documents WHERE id = ?", (document_id,))
+    
+    def _split_passages(self, text: str) -> List[str]:
+        passages = []
+        current = []
+        current_words = 0
+        
+        for sentence in re.split(r'(?<=[.!?])\s+|\n\s*\n', text):
+            sentence = ' '.join(sentence.split())
+            if not sentence:
+                continue
+            
+            current.append(sentence)
+            current_words += len(sentence.split())
+            
+            if current_words >= CORPUS_PASSAGE_WORDS:
+                passages.append(' '.join(current))
+                current = []
+                current_words = 0
+        
+        if current:
+            passages.append(' '.join(current))
+        
+        return passages
+    
+    def _shingles(self, text: str) -> set:
+        words = re.findall(r'\w+', text.lower())
+        size = self.shingle_size
+        
+        if len(words) < size:
+            grams = [' '.join(words)] if words else []
+        else:
+            grams = [' '.join(words[i:i + size]) for i in range(len(words) - size + 1)]
+        
+        return {self._hash_shingle(gram) for gram in grams}
+    
+    def _hash_shingle(self, gram: str) -> int:
+        digest = hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'big', signed=True)
+    
+    def test_connection(self) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM passages LIMIT 1").fetchone() is not None
+    
+    def search(self, query: str, max_results: int = MAX_RESULTS_PER_SEARCH) -> List[Dict]:
+        if not query or len(query.strip()) < 4:
+            return []
+        
+        shingles = list(self._shingles(query))
+        if not shingles:
+            return []
+        
+        placeholders = ','.join('?' * len(shingles))
+        
+        with self._lock:
+            self.queries_served += 1
+            rows = self._conn.execute(f"""
+                SELECT p.id, p.text, d.path, d.title, COUNT(*) AS hits
+                FROM postings AS s
+                JOIN passages AS p ON p.id = s.passage_id
+                JOIN documents AS d ON d.id = p.document_id
+                WHERE s.shingle IN ({placeholders})
+                GROUP BY p.id
+                HAVING hits >= ?
+                ORDER BY hits DESC, p.id
+                LIMIT ?
+            """, (*shingles, CORPUS_MIN_SHARED_SHINGLES, max_results)).fetchall()
+        
+        results = []
+        for _, text, path, title, _ in rows:
+            link = Path(path).as_uri() if os.path.isabs(path) else path
+            results.append({
+                'title': title,
+                'link': link,
+                'snippet': text,
+                'display_link': f"local:{Path(path).name}",
+                'formatted_url': path
+            })
+        
+        return results
+    
+    def get_document_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+    
+    def get_stats(self) -> Dict:
+        stats = super().get_stats()
+        stats['queries_served'] = self.queries_served
+        stats['documents'] = self.get_document_count()
+        return stats
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python corpus.py <directory> [index_path]")
+        return 1
+    
+    index_path = sys.argv[2] if len(sys.argv) > 2 else CORPUS_INDEX_PATH
+    corpus = LocalCorpusSearch(index_path)
+    ingested = corpus.ingest_directory(sys.argv[1])
+    print(f"✅ Indexed {ingested} new or changed documents ({corpus.get_document_count()} total)")
+    corpus.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,7 @@ import threading
 import time
 import webbrowser
 from typing import Dict, Optional
-from checker import PlagiarismChecker
+from checker import PlagiarismChecker, resolve_sentence
 from config import *
 
 class ModernPlagiarismGUI:
@@ -16,6 +16,7 @@ class ModernPlagiarismGUI:
         
         self.setup_window()
         self.create_interface()
+        self.refresh_api_status()
         
     def setup_window(self):
         self.root.title("Plagiarism Checker Pro - AI-Powered Detection")
@@ -65,6 +66,21 @@ class ModernPlagiarismGUI:
         )
         self.api_label.place(relx=0.95, rely=0.15, anchor='ne')
         
+    def refresh_api_status(self):
+        self.checker.refresh_health_async(
+            lambda health: self.root.after(0, self.update_api_status, health)
+        )
+        
+    def update_api_status(self, health):
+        labels = {
+            'healthy': "API: Ready",
+            'reachable': "API: Reachable",
+            'degraded': "API: Degraded",
+            'unhealthy': "API: Unavailable",
+            'unknown': "API: Unknown"
+        }
+        self.api_label.config(text=labels.get(health['status'], "API: Unknown"))
+        
     def create_content_area(self, parent):
         content_frame = tk.Frame(parent, bg=THEME_COLORS['BACKGROUND'])
         content_frame.pack(fill=tk.BOTH, expand=True)
@@ -344,10 +360,16 @@ Natural language processing (NLP) is a subfield of linguistics, computer science
             messagebox.showwarning("Warning", "Text is too short! Please enter at least 10 words.")
             return
             
-        if not self.checker.test_connection():
-            messagebox.showerror("Connection Error", 
-                               "Cannot connect to search API. Please check your internet connection and API configuration!")
-            return
+        health = self.checker.get_health()
+        if health['status'] == 'unhealthy':
+            self.checker.refresh_health_async(
+                lambda health: self.root.after(0, self.update_api_status, health), force=True
+            )
+            if not messagebox.askyesno("Connection Problem",
+                                       "The search API failed recently. The connection is being rechecked in the background.\n\n"
+                                       f"Last error: {health['last_error']}\n\n"
+                                       "Start the analysis anyway?"):
+                return
             
         if self.is_checking:
             return
@@ -362,21 +384,24 @@ Natural language processing (NLP) is a subfield of linguistics, computer science
         
     def analyze_text(self, text):
         try:
-            def progress_callback(current, total, sentence):
-                self.root.after(0, self.update_progress, current, total, sentence)
-                
-            report = self.checker.check_text(text, progress_callback)
-            self.root.after(0, self.show_results, report)
+            for event in self.checker.check_text_stream(text):
+                if event['type'] == 'sentence':
+                    self.root.after(0, self.update_progress, event['completed'], event['total'], event['stats'])
+                else:
+                    self.root.after(0, self.show_results, event['report'])
             
         except Exception as e:
             self.root.after(0, self.show_error, str(e))
         finally:
             self.root.after(0, self.analysis_complete)
             
-    def update_progress(self, current, total, sentence):
+    def update_progress(self, current, total, stats):
         percentage = (current / total) * 100
         self.progress_bar['value'] = percentage
-        self.progress_var.set(f"Analyzing sentence {current}/{total}...")
+        self.progress_var.set(
+            f"Analyzing sentence {current}/{total}... "
+            f"{stats['plagiarized_sentences']} flagged so far ({stats['plagiarism_percentage']}%)"
+        )
         
     def show_progress(self):
         for widget in self.results_container.winfo_children():
@@ -414,6 +439,7 @@ Natural language processing (NLP) is a subfield of linguistics, computer science
         self.is_checking = False
         self.hide_progress()
         self.enable_controls()
+        self.update_api_status(self.checker.get_health())
         
     def show_results(self, report):
         self.current_report = report
@@ -427,9 +453,22 @@ Natural language processing (NLP) is a subfield of linguistics, computer science
         self.create_summary_tab(notebook, report)
         self.create_details_tab(notebook, report)
         self.create_recommendations_tab(notebook, report)
+        self.highlight_flagged(report)
         
         self.export_btn.config(state='normal')
         
+    def highlight_flagged(self, report):
+        self.text_area.tag_remove('flagged', 1.0, tk.END)
+        self.text_area.tag_config('flagged', background='#FEE2E2', foreground=THEME_COLORS['CRITICAL'])
+        
+        content = self.text_area.get(1.0, tk.END)
+        base = len(content) - len(content.lstrip())
+        
+        for result in report['detailed_results']:
+            if result['is_plagiarism'] and result.get('span'):
+                start, end = result['span']
+                self.text_area.tag_add('flagged', f"1.0 + {base + start} chars", f"1.0 + {base + end} chars")
+        
     def create_summary_tab(self, notebook, report):
         summary_frame = tk.Frame(notebook, bg=THEME_COLORS['SURFACE'])
         notebook.add(summary_frame, text="📈 Summary")
@@ -601,7 +640,7 @@ Natural language processing (NLP) is a subfield of linguistics, computer science
         
         text_label = tk.Label(
             content_frame,
-            text=result['sentence'],
+            text=resolve_sentence(self.current_report, result),
             font=(FONTS['PRIMARY'][0], 10),
             fg=THEME_COLORS['TEXT_PRIMARY'],
             bg=THEME_COLORS['SURFACE_ALT'],
@@ -714,7 +753,7 @@ Natural language processing (NLP) is a subfield of linguistics, computer science
             file.write("-" * 20 + "\n")
             for i, result in enumerate(problematic, 1):
                 file.write(f"Sentence {i} ({result['similarity']:.1%} match):\n")
-                file.write(f"Text: {result['sentence']}\n")
+                file.write(f"Text: {resolve_sentence(report, result)}\n")
                 if result.get('source'):
                     file.write(f"Source: {result['source']}\n")
                 file.write("\n")
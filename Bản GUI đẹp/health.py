@@ -0,0 +1,80 @@
+import time
+import threading
+from collections import deque
+from typing import Dict
+from config import *
+
+class ConnectionHealth:
+    def __init__(self, window: int = HEALTH_WINDOW, stale_after: float = HEALTH_STALE_AFTER):
+        self.stale_after = stale_after
+        self._outcomes = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.success_count = 0
+        self.error_count = 0
+        self.last_success = None
+        self.last_failure = None
+        self.last_reachable = None
+        self.last_error = ''
+        
+    def record_success(self):
+        with self._lock:
+            now = time.time()
+            self._outcomes.append(True)
+            self.success_count += 1
+            self.last_success = now
+    
+    def record_failure(self, error: str):
+        with self._lock:
+            now = time.time()
+            self._outcomes.append(False)
+            self.error_count += 1
+            self.last_failure = now
+            self.last_error = error
+    
+    def record_reachable(self):
+        with self._lock:
+            self.last_reachable = time.time()
+    
+    def is_stale(self) -> bool:
+        with self._lock:
+            last_seen = max(self.last_success or 0, self.last_failure or 0, self.last_reachable or 0)
+        return time.time() - last_seen > self.stale_after
+    
+    def get_status(self) -> str:
+        if self.is_stale():
+            return 'unknown'
+        
+        with self._lock:
+            outcomes = list(self._outcomes)
+            last_outcome = max(self.last_success or 0, self.last_failure or 0)
+            reachable_only = self.last_reachable is not None and self.last_reachable > last_outcome
+        
+        if reachable_only or not outcomes:
+            return 'reachable'
+        
+        error_rate = outcomes.count(False) / len(outcomes)
+        if error_rate >= HEALTH_UNHEALTHY_ERROR_RATE:
+            return 'unhealthy'
+        elif error_rate > 0:
+            return 'degraded'
+        return 'healthy'
+    
+    def snapshot(self) -> Dict:
+        status = self.get_status()
+        
+        with self._lock:
+            outcomes = list(self._outcomes)
+            recent = len(outcomes)
+            errors = outcomes.count(False)
+            
+            return {
+                'status': status,
+                'success_rate': round((recent - errors) / recent, 3) if recent else None,
+                'error_rate': round(errors / recent, 3) if recent else None,
+                'success_count': self.success_count,
+                'error_count': self.error_count,
+                'last_success': self.last_success,
+                'last_failure': self.last_failure,
+                'last_reachable': self.last_reachable,
+                'last_error': self.last_error
+            }
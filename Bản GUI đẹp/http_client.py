@@ -0,0 +1,154 @@
+import ssl
+import json
+import atexit
+import asyncio
+import weakref
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+from config import *
+
+if TYPE_CHECKING:
+    import aiohttp
+
+class HTTPClientError(Exception):
+    pass
+
+class HTTPResponse:
+    def __init__(self, status_code: int, headers: Dict[str, str], body: bytes):
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        
+    @property
+    def text(self) -> str:
+        return self.body.decode('utf-8', errors='replace')
+    
+    def json(self):
+        return json.loads(self.text)
+
+_clients = weakref.WeakSet()
+
+class AsyncHTTPClient:
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE, keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT,
+                 timeout: float = HTTP_TIMEOUT, headers: Optional[Dict[str, str]] = None):
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self._sessions = {}
+        self._ssl_context = None
+        _clients.add(self)
+    
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        import aiohttp
+        
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_size,
+                keepalive_timeout=self.keepalive_timeout,
+                ssl=self._get_ssl_context()
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'Accept': 'application/json', **self.headers},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trust_env=True,
+                trace_configs=[self._trace_config()]
+            )
+            self._sessions[loop] = session
+        
+        return session
+    
+    def _trace_config(self) -> 'aiohttp.TraceConfig':
+        import aiohttp
+        
+        async def on_connection_create_end(session, context, params):
+            self.connections_opened += 1
+        
+        async def on_connection_reuseconn(session, context, params):
+            self.connections_reused += 1
+        
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+    
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        if self._ssl_context is None:
+            try:
+                import certifi
+                self._ssl_context = ssl.create_default_context(cafile=certifi.where())
+            except ImportError:
+                self._ssl_context = ssl.create_default_context()
+        return self._ssl_context
+    
+    async def get(self, url: str, params: Optional[Dict] = None, timeout: Optional[float] = None) -> HTTPResponse:
+        import aiohttp
+        
+        session = self._get_session()
+        request_timeout = aiohttp.ClientTimeout(total=timeout) if timeout is not None else None
+        
+        try:
+            async with session.get(url, params=params, timeout=request_timeout) as response:
+                body = await response.read()
+                headers = {name.lower(): value for name, value in response.headers.items()}
+                return HTTPResponse(response.status, headers, body)
+        except asyncio.TimeoutError:
+            raise HTTPClientError(f"Request timed out after {timeout or self.timeout}s")
+        except (aiohttp.ClientError, ValueError) as e:
+            raise HTTPClientError(str(e) or e.__class__.__name__)
+    
+    async def close(self):
+        loop = asyncio.get_running_loop()
+        session = self._sessions.pop(loop, None)
+        if session is not None:
+            await session.close()
+    
+    def get_stats(self) -> Dict:
+        return {
+            'pool_size': self.pool_size,
+            'connections_opened': self.connections_opened,
+            'connections_reused': self.connections_reused
+        }
+
+class EventLoopThread:
+    def __init__(self):
+        self._loop = None
+        self._lock = threading.Lock()
+        
+    def run(self, coroutine, timeout: Optional[float] = None):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._get_loop()).result(timeout)
+    
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name='http-client-loop', daemon=True).start()
+            return self._loop
+    
+    def is_running(self) -> bool:
+        with self._lock:
+            return self._loop is not None and self._loop.is_running()
+
+_shared_loop = EventLoopThread()
+
+def _close_clients():
+    if not _shared_loop.is_running():
+        return
+    
+    for client in list(_clients):
+        try:
+            _shared_loop.run(client.close(), timeout=5)
+        except Exception:
+            pass
+
+atexit.register(_close_clients)
+
+def run_sync(coroutine, timeout: Optional[float] = None):
+    return _shared_loop.run(coroutine, timeout)
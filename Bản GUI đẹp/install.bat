@@ -35,12 +35,13 @@ if errorlevel 1 (
     echo [WARNING] Some packages may have failed to install
     echo Trying alternative installation method...
     echo.
-    pip install requests urllib3 certifi
+    pip install aiohttp certifi numpy
 )
 
 echo.
 echo [INFO] Verifying installation...
-python -c "import requests; print('✓ requests installed')" 2>nul || echo "✗ requests installation failed"
+python -c "import aiohttp; print('✓ aiohttp installed')" 2>nul || echo "✗ aiohttp installation failed"
+python -c "import numpy; print('✓ numpy installed')" 2>nul || echo "✗ numpy installation failed"
 python -c "import tkinter; print('✓ tkinter available')" 2>nul || echo "✗ tkinter not available"
 
 echo.
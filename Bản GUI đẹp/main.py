@@ -1,8 +1,16 @@
+import time
+
+STARTUP_TIME = time.perf_counter()
+
 import sys
 import os
 import traceback
-from tkinter import messagebox
-import tkinter as tk
+import importlib.util
+
+startup_timings = []
+
+def mark_startup(stage):
+    startup_timings.append((stage, time.perf_counter() - STARTUP_TIME))
 
 def check_python_version():
     if sys.version_info < (3, 7):
@@ -11,10 +19,15 @@ def check_python_version():
         return False
     return True
 
+def uses_google_backend():
+    from config import SEARCH_BACKEND
+    return SEARCH_BACKEND in ('google', 'chain')
+
 def check_required_modules():
     required_modules = {
-        'tkinter': 'tkinter',
-        'requests': 'requests',
+        'tkinter': '_tkinter',
+        'asyncio': 'asyncio',
+        'sqlite3': 'sqlite3',
         'typing': 'typing',
         'threading': 'threading',
         'time': 'time',
@@ -22,12 +35,13 @@ def check_required_modules():
         'webbrowser': 'webbrowser'
     }
     
+    if uses_google_backend():
+        required_modules['aiohttp'] = 'aiohttp'
+    
     missing_modules = []
     
     for module_name, import_name in required_modules.items():
-        try:
-            __import__(import_name)
-        except ImportError:
+        if importlib.util.find_spec(import_name) is None:
             missing_modules.append(module_name)
     
     if missing_modules:
@@ -35,14 +49,22 @@ def check_required_modules():
         for module in missing_modules:
             print(f"   • {module}")
         print("\n📦 Install missing modules with:")
-        print("pip install requests")
+        print("pip install -r requirements.txt")
         return False
     
     return True
 
 def check_configuration():
     try:
-        from config import API_KEY, SEARCH_ENGINE_ID, BASE_URL
+        from config import API_KEY, SEARCH_ENGINE_ID, BASE_URL, SEARCH_BACKEND
+        
+        if SEARCH_BACKEND not in ('google', 'local', 'chain', 'fake'):
+            print(f"❌ Unknown SEARCH_BACKEND '{SEARCH_BACKEND}' in config.py")
+            return False
+        
+        if not uses_google_backend():
+            print(f"💡 Search backend '{SEARCH_BACKEND}' does not use the Google API, skipping API settings")
+            return True
         
         if not API_KEY or API_KEY == "YOUR_API_KEY_HERE":
             print("❌ API_KEY not configured in config.py")
@@ -90,25 +112,6 @@ def check_file_structure():
     
     return True
 
-def test_api_connection():
-    try:
-        from api import GoogleSearchAPI
-        
-        print("🔍 Testing API connection...")
-        api = GoogleSearchAPI()
-        
-        if api.test_connection():
-            print("✅ API connection successful!")
-            return True
-        else:
-            print("❌ API connection failed!")
-            print("   Please check your API key and internet connection")
-            return False
-            
-    except Exception as e:
-        print(f"❌ API test error: {e}")
-        return False
-
 def run_system_checks():
     print("🚀 PLAGIARISM CHECKER PRO - SYSTEM CHECK")
     print("=" * 55)
@@ -117,8 +120,7 @@ def run_system_checks():
         ("Python Version", check_python_version),
         ("Required Modules", check_required_modules),
         ("File Structure", check_file_structure),
-        ("Configuration", check_configuration),
-        ("API Connection", test_api_connection)
+        ("Configuration", check_configuration)
     ]
     
     all_passed = True
@@ -139,6 +141,8 @@ def run_system_checks():
 
 def show_startup_error(message):
     try:
+        import tkinter as tk
+        from tkinter import messagebox
         root = tk.Tk()
         root.withdraw()
         messagebox.showerror("Startup Error", message)
@@ -146,26 +150,49 @@ def show_startup_error(message):
     except:
         print(f"❌ STARTUP ERROR: {message}")
 
+def print_startup_profile():
+    print("\n⏱️  STARTUP PROFILE")
+    print("=" * 40)
+    previous = 0.0
+    for stage, elapsed in startup_timings:
+        print(f"{stage:<24}{elapsed * 1000:>8.1f} ms  (+{(elapsed - previous) * 1000:.1f} ms)")
+        previous = elapsed
+
 def main():
+    profile_startup = '--profile-startup' in sys.argv[1:]
+    mark_startup("Interpreter ready")
+    
     try:
         if not run_system_checks():
             error_msg = ("System checks failed!\n\n"
                         "Please check the console output for details and fix any issues before running the application.\n\n"
                         "Common solutions:\n"
-                        "• Install missing modules: pip install requests\n"
+                        "• Install missing modules: pip install -r requirements.txt\n"
                         "• Configure API keys in config.py\n"
                         "• Check internet connection")
             show_startup_error(error_msg)
-            input("\nPress Enter to exit...")
+            if not profile_startup:
+                input("\nPress Enter to exit...")
             return
         
+        mark_startup("System checks")
         print("\n🎉 All system checks passed!")
+        if uses_google_backend():
+            print("🔍 API connection is not checked at startup, it is probed in the background once the window opens")
         print("🚀 Starting Plagiarism Checker Pro...")
         print("=" * 40)
         
         from gui import ModernPlagiarismGUI
+        mark_startup("GUI modules imported")
         
         app = ModernPlagiarismGUI()
+        mark_startup("Window created")
+        
+        if profile_startup:
+            app.root.update()
+            mark_startup("First frame drawn")
+            app.root.destroy()
+            return
         
         print("✅ Application started successfully!")
         print("💡 Close this console window will also close the application")
@@ -188,8 +215,11 @@ def main():
         traceback.print_exc()
         
     finally:
-        print("\n👋 Thank you for using Plagiarism Checker Pro!")
-        input("Press Enter to exit...")
+        if profile_startup:
+            print_startup_profile()
+        else:
+            print("\n👋 Thank you for using Plagiarism Checker Pro!")
+            input("Press Enter to exit...")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,172 @@
+import io
+import time
+import random
+import sys
+import threading
+import cProfile
+import pstats
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, List
+from config import *
+
+_profile_lock = threading.RLock()
+_exporters: List[Callable[[Dict], None]] = []
+_exporters_lock = threading.Lock()
+
+def register_exporter(callback: Callable[[Dict], None]):
+    with _exporters_lock:
+        if callback not in _exporters:
+            _exporters.append(callback)
+
+def unregister_exporter(callback: Callable[[Dict], None]):
+    with _exporters_lock:
+        if callback in _exporters:
+            _exporters.remove(callback)
+
+class Histogram:
+    def __init__(self, max_samples: int = METRICS_MAX_SAMPLES, seed: int = 0):
+        self.max_samples = max(1, int(max_samples))
+        self.samples = []
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self._rng = random.Random(seed)
+    
+    def observe(self, value: float):
+        self.count += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+        
+        if len(self.samples) < self.max_samples:
+            self.samples.append(value)
+        else:
+            slot = self._rng.randrange(self.count)
+            if slot < self.max_samples:
+                self.samples[slot] = value
+    
+    def percentile(self, p: float) -> float:
+        if not self.samples:
+            return 0.0
+        
+        ordered = sorted(self.samples)
+        rank = (len(ordered) - 1) * p / 100
+        lower = int(rank)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+    
+    def summary(self, scale: float = 1000.0) -> Dict:
+        return {
+            'count': self.count,
+            'mean': round(self.total / self.count * scale, 3) if self.count else 0.0,
+            'min': round((self.minimum or 0.0) * scale, 3),
+            'p50': round(self.percentile(50) * scale, 3),
+            'p95': round(self.percentile(95) * scale, 3),
+            'p99': round(self.percentile(99) * scale, 3),
+            'max': round((self.maximum or 0.0) * scale, 3)
+        }
+
+class Metrics:
+    def __init__(self, profile: bool = False):
+        self.started = time.perf_counter()
+        self.stages = defaultdict(float)
+        self.counters = defaultdict(int)
+        self.histograms = defaultdict(Histogram)
+        self.info = {}
+        self.profile = profile
+        self._profile_stats = None
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+    
+    def add_time(self, name: str, seconds: float):
+        with self._lock:
+            self.stages[name] += seconds
+    
+    def increment(self, name: str, amount: int = 1):
+        with self._lock:
+            self.counters[name] += amount
+    
+    def set_info(self, name: str, value):
+        with self._lock:
+            self.info[name] = value
+    
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            self.histograms[name].observe(seconds)
+    
+    def call(self, func: Callable, *args):
+        if not self.profile:
+            return func(*args)
+        
+        with _profile_lock:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                return func(*args)
+            
+            try:
+                return func(*args)
+            finally:
+                profiler.disable()
+                self._merge_profile(profiler)
+    
+    def _merge_profile(self, profiler: cProfile.Profile):
+        try:
+            stats = pstats.Stats(profiler)
+        except TypeError:
+            return
+        
+        with self._lock:
+            if self._profile_stats is None:
+                self._profile_stats = stats
+            else:
+                self._profile_stats.add(stats)
+    
+    def get_profile(self, limit: int = METRICS_PROFILE_LINES) -> str:
+        with self._lock:
+            if self._profile_stats is None:
+                return ''
+            
+            stream = io.StringIO()
+            self._profile_stats.stream = stream
+            self._profile_stats.sort_stats('cumulative').print_stats(limit)
+            return stream.getvalue()
+    
+    def snapshot(self) -> Dict:
+        with self._lock:
+            snapshot = {
+                'wall_time': round(time.perf_counter() - self.started, 4),
+                'stages': {name: round(seconds, 4) for name, seconds in self.stages.items()},
+                'counters': dict(self.counters),
+                'histograms_ms': {name: histogram.summary() for name, histogram in self.histograms.items()}
+            }
+            if self.info:
+                snapshot['info'] = dict(self.info)
+        
+        if self.profile:
+            snapshot['profile'] = self.get_profile()
+        return snapshot
+    
+    def publish(self) -> Dict:
+        snapshot = self.snapshot()
+        
+        with _exporters_lock:
+            exporters = list(_exporters)
+        
+        for exporter in exporters:
+            try:
+                exporter(snapshot)
+            except Exception as e:
+                print(f"⚠️ Metrics exporter failed: {e}", file=sys.stderr)
+        
+        return snapshot
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from config import *
+
+class RateLimiter:
+    def __init__(self, rate: float = REQUESTS_PER_SECOND, burst: int = RATE_LIMIT_BURST):
+        if rate <= 0:
+            raise ValueError("Rate must be greater than zero")
+        
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired_count = 0
+        self.throttled_count = 0
+        self.total_wait = 0.0
+        self.throttled_time = 0.0
+        self._throttled_until = 0.0
+        
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            self.acquired_count += 1
+            
+            if self._tokens >= 0:
+                return 0.0
+            
+            wait = -self._tokens / self.rate
+            release_at = now + wait
+            self.throttled_count += 1
+            self.total_wait += wait
+            self.throttled_time += release_at - max(now, self._throttled_until)
+            self._throttled_until = release_at
+            return wait
+    
+    def acquire(self) -> float:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    async def acquire_async(self) -> float:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+    
+    def get_throttled_time(self) -> float:
+        with self._lock:
+            return self.throttled_time
+    
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'burst': self.burst,
+                'acquired': self.acquired_count,
+                'throttled': self.throttled_count,
+                'total_wait': round(self.total_wait, 3),
+                'throttled_time': round(self.throttled_time, 3)
+            }
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+def get_shared_limiter() -> RateLimiter:
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter()
+        return _shared_limiter
@@ -0,0 +1,97 @@
+import sys
+from typing import Dict, Iterator, Optional, Tuple
+
+class SentenceResult:
+    __slots__ = ('sentence', 'similarity', 'source', 'source_title', 'source_domain', 'matched_text',
+                 'is_plagiarism', 'confidence_level', 'risk_score', 'error', 'span')
+    
+    FIELDS = ('sentence', 'similarity', 'source', 'source_title', 'source_domain', 'matched_text',
+              'is_plagiarism', 'confidence_level', 'risk_score', 'error', 'span')
+    OPTIONAL_FIELDS = ('sentence', 'error', 'span')
+    
+    def __init__(self, sentence: Optional[str], similarity: float = 0.0, source: Optional[str] = None,
+                 source_title: str = '', source_domain: str = '', matched_text: str = '',
+                 is_plagiarism: bool = False, confidence_level: str = 'very_low', risk_score: int = 0,
+                 error: Optional[str] = None, span: Optional[Tuple[int, int]] = None):
+        self.sentence = sentence
+        self.similarity = similarity
+        self.source = source
+        self.source_title = source_title
+        self.source_domain = sys.intern(source_domain) if source_domain else ''
+        self.matched_text = matched_text
+        self.is_plagiarism = is_plagiarism
+        self.confidence_level = sys.intern(confidence_level)
+        self.risk_score = risk_score
+        self.error = error
+        self.span = span
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SentenceResult':
+        return cls(**{key: data[key] for key in cls.FIELDS if key in data})
+    
+    def keys(self) -> Iterator[str]:
+        for key in self.FIELDS:
+            if key not in self.OPTIONAL_FIELDS or getattr(self, key) is not None:
+                yield key
+    
+    def items(self) -> Iterator[Tuple[str, object]]:
+        for key in self.keys():
+            yield key, getattr(self, key)
+    
+    def to_dict(self) -> Dict:
+        return dict(self.items())
+    
+    def without_sentence(self) -> 'SentenceResult':
+        copy = SentenceResult.__new__(SentenceResult)
+        for key in self.FIELDS:
+            setattr(copy, key, getattr(self, key))
+        copy.sentence = None
+        return copy
+    
+    def get(self, key: str, default=None):
+        if key in self:
+            return getattr(self, key)
+        return default
+    
+    def __getitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key: str, value):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __contains__(self, key: str) -> bool:
+        if key in self.OPTIONAL_FIELDS:
+            return getattr(self, key) is not None
+        return key in self.FIELDS
+    
+    def __iter__(self) -> Iterator[str]:
+        return self.keys()
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self.keys())
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (SentenceResult, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"SentenceResult({self.to_dict()!r})"
+
+def to_jsonable(value):
+    if isinstance(value, SentenceResult):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def report_to_dict(value):
+    if isinstance(value, SentenceResult):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: report_to_dict(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [report_to_dict(item) for item in value]
+    return value
@@ -0,0 +1,213 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Optional
+from config import *
+
+class CircuitOpenError(Exception):
+    pass
+
+class RetryBudget:
+    def __init__(self, limit: int = RETRY_BUDGET_PER_DOCUMENT):
+        self.limit = max(0, int(limit))
+        self.used = 0
+        self._lock = threading.Lock()
+    
+    def consume(self) -> bool:
+        with self._lock:
+            if self.used >= self.limit:
+                return False
+            self.used += 1
+            return True
+    
+    def get_remaining(self) -> int:
+        with self._lock:
+            return self.limit - self.used
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = CIRCUIT_RESET_TIMEOUT):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.trip_count = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+    
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+            
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+    
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._trial_in_flight = False
+    
+    def release_trial(self):
+        with self._lock:
+            self._trial_in_flight = False
+    
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            self._trial_in_flight = False
+            
+            if self.state == self.HALF_OPEN or (
+                    self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self.trip_count += 1
+    
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'trips': self.trip_count
+            }
+
+class RetryPolicy:
+    def __init__(self, max_attempts: int = RETRY_MAX_ATTEMPTS, base_delay: float = RETRY_BASE_DELAY,
+                 max_delay: float = RETRY_MAX_DELAY, breaker: Optional[CircuitBreaker] = None,
+                 rng: Optional[random.Random] = None):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker
+        self.budget = RetryBudget()
+        self.rng = rng or random.Random()
+        self.retry_count = 0
+        self.given_up_count = 0
+        self.total_backoff = 0.0
+        self._lock = threading.Lock()
+    
+    def start_budget(self, limit: int = RETRY_BUDGET_PER_DOCUMENT):
+        self.budget = RetryBudget(limit)
+    
+    def compute_delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        delay = self.rng.uniform(0, ceiling)
+        
+        if retry_after is not None:
+            if retry_after > self.max_delay:
+                return None
+            delay = max(delay, retry_after)
+        
+        return delay
+    
+    def call(self, func: Callable[[], object]):
+        attempt = 0
+        
+        while True:
+            self._check_breaker()
+            try:
+                result = func()
+            except Exception as e:
+                delay = self._handle_failure(e, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            
+            self._record_success()
+            return result
+    
+    async def call_async(self, func: Callable[[], Awaitable]):
+        attempt = 0
+        
+        while True:
+            self._check_breaker()
+            try:
+                result = await func()
+            except Exception as e:
+                delay = self._handle_failure(e, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            
+            self._record_success()
+            return result
+    
+    def _check_breaker(self):
+        if self.breaker is not None and not self.breaker.allow_request():
+            raise CircuitOpenError("Circuit breaker open: search backend is unavailable")
+    
+    def _record_success(self):
+        if self.breaker is not None:
+            self.breaker.record_success()
+    
+    def _handle_failure(self, error: Exception, attempt: int) -> Optional[float]:
+        if not getattr(error, 'retryable', False):
+            if self.breaker is not None:
+                if getattr(error, 'status_code', None) in (401, 403):
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.release_trial()
+            return None
+        
+        if self.breaker is not None:
+            if getattr(error, 'status_code', None) == 429:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+        
+        delay = None
+        if attempt + 1 < self.max_attempts and self._breaker_allows_retry():
+            delay = self.compute_delay(attempt, getattr(error, 'retry_after', None))
+            if delay is not None and not self.budget.consume():
+                delay = None
+        
+        with self._lock:
+            if delay is None:
+                self.given_up_count += 1
+            else:
+                self.retry_count += 1
+                self.total_backoff += delay
+        
+        return delay
+    
+    def _breaker_allows_retry(self) -> bool:
+        return self.breaker is None or self.breaker.state == CircuitBreaker.CLOSED
+    
+    def get_retry_count(self) -> int:
+        with self._lock:
+            return self.retry_count
+    
+    def get_trip_count(self) -> int:
+        return self.breaker.trip_count if self.breaker is not None else 0
+    
+    def get_stats(self) -> Dict:
+        with self._lock:
+            stats = {
+                'retries': self.retry_count,
+                'given_up': self.given_up_count,
+                'total_backoff': round(self.total_backoff, 3),
+                'budget_remaining': self.budget.get_remaining()
+            }
+        
+        if self.breaker is not None:
+            stats['circuit_breaker'] = self.breaker.get_stats()
+        return stats
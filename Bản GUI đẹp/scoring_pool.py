@@ -0,0 +1,185 @@
+import os
+import atexit
+import multiprocessing
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from config import *
+
+if TYPE_CHECKING:
+    from analyzer import TextFeatures
+
+_worker_analyzer = None
+
+def _get_worker_analyzer(sequence_engine: str, weights: List[float]):
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        from analyzer import TextAnalyzer
+        _worker_analyzer = TextAnalyzer()
+        _worker_analyzer.scoring_mode = 'pruned'
+        _worker_analyzer.lsh = None
+    
+    _worker_analyzer.sequence_engine = sequence_engine
+    _worker_analyzer.weights = list(weights)
+    return _worker_analyzer
+
+def _read_features(buffer, count: int, wanted: set) -> Dict[int, 'TextFeatures']:
+    from analyzer import TextFeatures
+    
+    offsets = buffer[:8 * (count + 1)].cast('Q')
+    base = 8 * (count + 1)
+    features = {}
+    
+    def segment(index: int) -> str:
+        return bytes(buffer[base + offsets[index]:base + offsets[index + 1]]).decode('utf-8')
+    
+    try:
+        for text_id in wanted:
+            features[text_id] = TextFeatures(segment(2 * text_id), segment(2 * text_id + 1).split())
+    finally:
+        offsets.release()
+    
+    return features
+
+def _score_chunk(source: Tuple, settings: Tuple, chunk: Tuple[array, array, array]) -> List[Tuple[Optional[int], float]]:
+    sentence_ids, bounds, candidate_ids = chunk
+    analyzer = _get_worker_analyzer(*settings)
+    wanted = set(sentence_ids) | set(candidate_ids)
+    
+    kind, payload, count = source
+    if kind == 'shm':
+        block = shared_memory.SharedMemory(name=payload)
+        try:
+            buffer = block.buf
+            features = _read_features(buffer, count, wanted)
+            del buffer
+        finally:
+            block.close()
+    else:
+        with memoryview(payload) as buffer:
+            features = _read_features(buffer, count, wanted)
+    
+    results = []
+    for position, sentence_id in enumerate(sentence_ids):
+        candidates = (features[text_id] for text_id in candidate_ids[bounds[position]:bounds[position + 1]])
+        results.append(analyzer.best_match_features(features[sentence_id], candidates))
+    
+    return results
+
+def _process_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+class ScoringPool:
+    def __init__(self, workers: int = SCORING_WORKERS, chunk_size: int = SCORING_CHUNK_SIZE,
+                 shared_memory_threshold: int = SHARED_MEMORY_MIN_BYTES):
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size)
+        self.shared_memory_threshold = shared_memory_threshold
+        self.batches = 0
+        self.sentences_scored = 0
+        self._executor = None
+        self._lock = threading.Lock()
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=_process_context())
+            return self._executor
+    
+    def best_matches(self, sentences: List[str], candidates: List[List[str]], sequence_engine: str,
+                     weights: List[float], get_features: Optional[Callable] = None) -> List[Tuple[Optional[int], float]]:
+        if len(sentences) != len(candidates):
+            raise ValueError("Each sentence needs its own candidate list")
+        if not sentences:
+            return []
+        
+        if get_features is None:
+            get_features = _get_worker_analyzer(sequence_engine, weights).get_features
+        
+        text_ids = {}
+        encoded = []
+        
+        def intern(text: str) -> int:
+            text_id = text_ids.get(text)
+            if text_id is None:
+                text_id = text_ids[text] = len(encoded) // 2
+                features = get_features(text) if text else None
+                if features is None:
+                    encoded.extend((b'', b''))
+                else:
+                    encoded.extend((features.normalized.encode('utf-8'), ' '.join(features.words).encode('utf-8')))
+            return text_id
+        
+        sentence_ids = array('I', (intern(sentence) for sentence in sentences))
+        bounds = array('I', [0])
+        candidate_ids = array('I')
+        for snippets in candidates:
+            candidate_ids.extend(intern(snippet) for snippet in snippets)
+            bounds.append(len(candidate_ids))
+        
+        offsets = array('Q', [0])
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        packed = offsets.tobytes() + b''.join(encoded)
+        
+        chunks = []
+        for start in range(0, len(sentence_ids), self.chunk_size):
+            end = min(start + self.chunk_size, len(sentence_ids))
+            chunks.append((
+                sentence_ids[start:end],
+                array('I', (bound - bounds[start] for bound in bounds[start:end + 1])),
+                candidate_ids[bounds[start]:bounds[end]]
+            ))
+        
+        settings = (sequence_engine, list(weights))
+        block = None
+        
+        if len(packed) >= self.shared_memory_threshold:
+            block = shared_memory.SharedMemory(create=True, size=len(packed))
+            block.buf[:len(packed)] = packed
+            source = ('shm', block.name, len(encoded))
+        else:
+            source = ('bytes', packed, len(encoded))
+        
+        try:
+            executor = self._get_executor()
+            chunk_results = list(executor.map(_score_chunk, [source] * len(chunks), [settings] * len(chunks), chunks))
+        finally:
+            if block is not None:
+                block.close()
+                block.unlink()
+        
+        with self._lock:
+            self.batches += 1
+            self.sentences_scored += len(sentences)
+        
+        return [result for chunk in chunk_results for result in chunk]
+    
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+    
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'batches': self.batches,
+                'sentences_scored': self.sentences_scored,
+                'running': self._executor is not None
+            }
+
+_shared_pool: Optional[ScoringPool] = None
+_shared_lock = threading.Lock()
+
+def get_shared_pool() -> ScoringPool:
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = ScoringPool()
+            atexit.register(_shared_pool.close)
+        return _shared_pool
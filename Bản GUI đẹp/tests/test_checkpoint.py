@@ -0,0 +1,73 @@
+import json
+import checker
+import cli
+from backends import FakeSearchBackend
+from checker import PlagiarismChecker
+from checkpoint import CheckpointStore
+
+DOCUMENT = (
+    "Artificial intelligence is changing how researchers analyse large collections of text. "
+    "Modern language models can summarise scientific articles in a few seconds. "
+    "Teachers worry that students may copy generated essays without attribution. "
+    "Universities are rewriting their academic integrity policies for the new tools."
+)
+
+def interrupt_check(store, sentences):
+    stream = PlagiarismChecker(FakeSearchBackend(), checkpoints=store).check_text_stream(DOCUMENT, max_workers=1)
+    for _ in range(sentences):
+        next(stream)
+    stream.close()
+
+def test_completed_check_deletes_its_journal(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    
+    for _ in range(2):
+        backend = FakeSearchBackend()
+        events = list(PlagiarismChecker(backend, checkpoints=store).check_text_stream(DOCUMENT))
+        
+        sentences = [event for event in events if event['type'] == 'sentence']
+        assert not any(event['resumed'] for event in sentences)
+        assert backend.requests_made == len(sentences) > 0
+        assert store.get_stats()['journals'] == 0
+
+def test_interrupted_check_resumes_from_journal(tmp_path):
+    store = CheckpointStore(str(tmp_path))
+    interrupt_check(store, 2)
+    assert store.get_stats()['journals'] == 1
+    
+    backend = FakeSearchBackend()
+    events = list(PlagiarismChecker(backend, checkpoints=store).check_text_stream(DOCUMENT, max_workers=1))
+    
+    sentences = [event for event in events if event['type'] == 'sentence']
+    assert [event['resumed'] for event in sentences].count(True) == 2
+    assert backend.requests_made == len(sentences) - 2
+    assert events[-1]['report']['summary']['total_sentences'] == len(sentences)
+    assert store.get_stats()['journals'] == 0
+
+def test_cli_check_marks_resumed_sentences(tmp_path, monkeypatch, capsys):
+    store = CheckpointStore(str(tmp_path / 'journals'))
+    monkeypatch.setattr(checker, 'CheckpointStore', lambda: store)
+    interrupt_check(store, 1)
+    
+    path = tmp_path / 'essay.txt'
+    path.write_text(DOCUMENT, encoding='utf-8')
+    cli.main(['check', '-b', 'fake', str(path)])
+    
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    resumed = [record['resumed'] for record in records if record['type'] == 'sentence']
+    assert resumed.count(True) == 1
+    assert len(resumed) > 1
+
+def test_cli_check_keeps_stdout_json_when_journal_fails(tmp_path, monkeypatch, capsys):
+    blocker = tmp_path / 'not-a-directory'
+    blocker.write_text('', encoding='utf-8')
+    monkeypatch.setattr(checker, 'CheckpointStore', lambda: CheckpointStore(str(blocker)))
+    
+    path = tmp_path / 'essay.txt'
+    path.write_text(DOCUMENT, encoding='utf-8')
+    cli.main(['check', '-b', 'fake', str(path)])
+    
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert records[-1]['type'] == 'document'
+    assert 'Checkpoint journal unavailable' in captured.err
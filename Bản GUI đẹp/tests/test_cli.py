@@ -0,0 +1,48 @@
+import json
+import backends
+import cli
+from backends import SearchBackend
+
+class FailingBackend(SearchBackend):
+    name = 'failing'
+    
+    def search(self, query, max_results=10):
+        raise Exception("API quota exceeded")
+
+DOCUMENT = (
+    "Artificial intelligence is changing how researchers analyse large collections of text. "
+    "Modern language models can summarise scientific articles in a few seconds. "
+    "Teachers worry that students may copy generated essays without attribution."
+)
+
+def write_document(tmp_path):
+    path = tmp_path / 'essay.txt'
+    path.write_text(DOCUMENT, encoding='utf-8')
+    return str(path)
+
+def test_check_exits_with_failure_when_every_search_fails(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(backends, 'create_backend', lambda name: FailingBackend())
+    
+    code = cli.main(['check', '--no-resume', '-s', write_document(tmp_path)])
+    
+    record = json.loads(capsys.readouterr().out.splitlines()[-1])
+    assert code == cli.EXIT_FAILURE
+    assert record['summary']['analyzed_sentences'] == 0
+    assert record['summary']['error_count'] == record['summary']['total_sentences'] > 0
+
+def test_batch_exits_with_failure_when_every_search_fails(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(backends, 'create_backend', lambda name: FailingBackend())
+    
+    code = cli.main(['batch', '-q', write_document(tmp_path)])
+    
+    result = json.loads(capsys.readouterr().out)
+    summary = list(result['reports'].values())[0]['summary']
+    assert code == cli.EXIT_FAILURE
+    assert summary['error_count'] == summary['total_sentences'] > 0
+
+def test_check_exits_with_risk_code_when_searches_succeed(tmp_path, capsys):
+    code = cli.main(['check', '--no-resume', '-s', '-b', 'fake', write_document(tmp_path)])
+    
+    record = json.loads(capsys.readouterr().out.splitlines()[-1])
+    assert record['summary']['analyzed_sentences'] > 0
+    assert code == cli.RISK_EXIT_CODES[record['summary']['risk_level']]
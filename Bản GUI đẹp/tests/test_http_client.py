@@ -0,0 +1,144 @@
+import os
+import sys
+import gzip
+import json
+import subprocess
+import time
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from api import GoogleSearchAPI, SearchAPIError
+from cache import SearchCache
+from http_client import AsyncHTTPClient, HTTPClientError, run_sync
+from retry import RetryPolicy
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    
+    def log_message(self, *args):
+        pass
+    
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query).get('q', [''])[0].strip('"')
+        
+        if parts.path == '/redirect':
+            self.send_body(302, b'', {'Location': '/search?q=redirected'})
+        elif parts.path == '/gzip':
+            self.send_body(200, gzip.compress(b'{"compressed": true}'), {'Content-Encoding': 'gzip'})
+        elif parts.path == '/slow':
+            time.sleep(1)
+            self.send_body(200, b'{}')
+        elif parts.path == '/chunked':
+            self.send_response(200)
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for chunk in (b'{"chun', b'ked": ', b'true}'):
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+            self.wfile.write(b'0\r\n\r\n')
+        elif 'flaky' in query and self.server.count('flaky') < 3:
+            self.send_body(429, b'{}', {'Retry-After': '0'})
+        elif 'quota' in query:
+            self.send_body(403, b'{}')
+        else:
+            items = [{'title': 'Source', 'link': 'https://source.test/page', 'snippet': f"{query} from the stub",
+                      'displayLink': 'source.test'}]
+            self.send_body(200, json.dumps({'items': items, 'path': self.path}).encode())
+    
+    def send_body(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.requests = []
+    
+    def count(self, query):
+        return sum(1 for path in self.requests if query in path)
+    
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+@pytest.fixture
+def server():
+    stub = StubServer()
+    thread = threading.Thread(target=stub.serve_forever, daemon=True)
+    thread.start()
+    yield stub
+    stub.shutdown()
+    stub.server_close()
+
+@pytest.fixture
+def client(monkeypatch):
+    for name in ('HTTP_PROXY', 'HTTPS_PROXY', 'ALL_PROXY', 'http_proxy', 'https_proxy', 'all_proxy'):
+        monkeypatch.delenv(name, raising=False)
+    http = AsyncHTTPClient(pool_size=4, timeout=5)
+    yield http
+    run_sync(http.close())
+
+def test_reuses_keep_alive_connections(server, client):
+    for i in range(5):
+        assert run_sync(client.get(server.url + '/search', params={'q': f'query {i}'})).status_code == 200
+    
+    stats = client.get_stats()
+    assert stats['connections_opened'] == 1
+    assert stats['connections_reused'] == 4
+
+def test_decodes_chunked_and_compressed_bodies(server, client):
+    assert run_sync(client.get(server.url + '/chunked')).json() == {'chunked': True}
+    assert run_sync(client.get(server.url + '/gzip')).json() == {'compressed': True}
+
+def test_follows_redirects(server, client):
+    response = run_sync(client.get(server.url + '/redirect'))
+    
+    assert response.status_code == 200
+    assert server.requests[-1] == '/search?q=redirected'
+
+def test_times_out(server, client):
+    with pytest.raises(HTTPClientError):
+        run_sync(client.get(server.url + '/slow', timeout=0.2))
+
+def test_honours_proxy_environment(server, client, monkeypatch):
+    monkeypatch.setenv('HTTP_PROXY', server.url)
+    monkeypatch.delenv('NO_PROXY', raising=False)
+    monkeypatch.delenv('no_proxy', raising=False)
+    
+    response = run_sync(client.get('http://search.invalid/search', params={'q': 'proxied'}))
+    
+    assert response.status_code == 200
+    assert server.requests[-1].startswith('http://search.invalid/search')
+
+def make_api(server, client):
+    api = GoogleSearchAPI(cache=SearchCache(':memory:'), http_client=client,
+                          retry_policy=RetryPolicy(base_delay=0.01, max_delay=0.05))
+    api.base_url = server.url + '/search'
+    return api
+
+def test_search_retries_rate_limited_requests(server, client):
+    results = make_api(server, client).search('flaky query about testing')
+    
+    assert results[0]['snippet'] == 'flaky query about testing from the stub'
+    assert server.count('flaky') == 3
+
+def test_search_reports_quota_errors(server, client):
+    with pytest.raises(SearchAPIError) as error:
+        make_api(server, client).search('quota query about testing')
+    
+    assert error.value.status_code == 403
+
+def test_offline_backends_do_not_import_aiohttp():
+    code = "import sys, checker, backends; backends.create_backend('fake'); print('aiohttp' in sys.modules)"
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout
+    
+    assert output.strip() == 'False'
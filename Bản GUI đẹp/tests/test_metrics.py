@@ -0,0 +1,43 @@
+import cProfile
+from backends import FakeSearchBackend
+from benchmark import generate_corpus
+from checker import PlagiarismChecker
+from metrics import Metrics, register_exporter, unregister_exporter
+
+def test_profiled_check_completes_with_profile_output():
+    text, sources = generate_corpus(20, seed=1)
+    checker = PlagiarismChecker(FakeSearchBackend(passages=sources), profile=True)
+    checker.checkpoints = None
+    
+    report = checker.check_text(text, max_workers=8)
+    
+    assert report['summary']['analyzed_sentences'] == report['summary']['total_sentences'] > 0
+    assert '_check_sentence' in report['performance']['profile']
+    assert report['performance']['info']['workers']['requested'] == 8
+    assert report['performance']['info']['workers']['used'] == 1
+
+def test_nested_profiled_calls_are_merged():
+    metrics = Metrics(profile=True)
+    
+    assert metrics.call(lambda: metrics.call(sum, [1, 2])) == 3
+    assert 'sum' in metrics.get_profile()
+
+def test_empty_profiler_is_ignored():
+    metrics = Metrics(profile=True)
+    metrics._merge_profile(cProfile.Profile())
+    
+    assert metrics.get_profile() == ''
+
+def test_failing_exporter_warns_on_stderr(capsys):
+    def exporter(snapshot):
+        raise RuntimeError("collector offline")
+    
+    register_exporter(exporter)
+    try:
+        Metrics().publish()
+    finally:
+        unregister_exporter(exporter)
+    
+    captured = capsys.readouterr()
+    assert captured.out == ''
+    assert 'collector offline' in captured.err
@@ -0,0 +1,19 @@
+import json
+from backends import FakeSearchBackend
+from benchmark import generate_corpus
+from checker import PlagiarismChecker
+from results import SentenceResult, report_to_dict
+
+def test_report_to_dict_makes_reports_json_serializable():
+    text, sources = generate_corpus(10, seed=3)
+    checker = PlagiarismChecker(FakeSearchBackend(passages=sources))
+    checker.checkpoints = None
+    report = checker.check_text(text)
+    assert isinstance(report['detailed_results'][0], SentenceResult)
+    
+    data = json.loads(json.dumps(report_to_dict(report)))
+    
+    assert data['summary'] == report['summary']
+    assert data['detailed_results'] == [
+        {**result.to_dict(), 'span': list(result.span)} for result in report['detailed_results']
+    ]
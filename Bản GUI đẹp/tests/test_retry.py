@@ -0,0 +1,47 @@
+import pytest
+from api import SearchAPIError
+from retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+def fail_with(error):
+    def func():
+        raise error
+    return func
+
+def test_non_retryable_error_keeps_failure_count():
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=60)
+    policy = RetryPolicy(max_attempts=1, breaker=breaker)
+    
+    for error in (SearchAPIError("Unavailable", 503, retryable=True),
+                  SearchAPIError("Unavailable", 503, retryable=True),
+                  SearchAPIError("Invalid response format from API")):
+        with pytest.raises(SearchAPIError):
+            policy.call(fail_with(error))
+    
+    assert breaker.get_stats() == {'state': 'closed', 'consecutive_failures': 2, 'trips': 0}
+
+def test_non_retryable_error_releases_half_open_trial():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    policy = RetryPolicy(max_attempts=1, breaker=breaker)
+    
+    with pytest.raises(SearchAPIError):
+        policy.call(fail_with(SearchAPIError("Unavailable", 503, retryable=True)))
+    with pytest.raises(SearchAPIError):
+        policy.call(fail_with(SearchAPIError("Invalid response format from API")))
+    
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.consecutive_failures == 1
+    assert policy.call(lambda: 'ok') == 'ok'
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_quota_errors_trip_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=60)
+    policy = RetryPolicy(max_attempts=1, breaker=breaker)
+    quota = SearchAPIError("API quota exceeded or invalid credentials", 403)
+    
+    for _ in range(5):
+        with pytest.raises(SearchAPIError):
+            policy.call(fail_with(quota))
+    
+    with pytest.raises(CircuitOpenError):
+        policy.call(fail_with(quota))
+    assert breaker.get_stats()['trips'] == 1
@@ -0,0 +1,57 @@
+import random
+import pytest
+from analyzer import TextAnalyzer
+from benchmark import generate_corpus, paraphrase
+
+EDGE_SNIPPETS = ['', '...', 'the and of', 'A', 'Sources: see above.']
+
+def scoring_corpus(sentences=24, snippets=40, seed=7):
+    rng = random.Random(seed)
+    text, sources = generate_corpus(sentences, plagiarism_rate=0.5, decoys=snippets, seed=seed)
+    document = TextAnalyzer().extract_sentences(text)
+    
+    candidates = sources[:snippets] + [paraphrase(rng.choice(document), 0.3, rng) for _ in range(10)]
+    return document + ['', 'the of and'], candidates + EDGE_SNIPPETS
+
+@pytest.mark.parametrize('engine', ['difflib', 'lcs', 'token_lcs'])
+def test_score_matrix_matches_calculate_similarity(engine):
+    sentences, snippets = scoring_corpus()
+    analyzer = TextAnalyzer()
+    analyzer.sequence_engine = engine
+    
+    matrix = analyzer.score_matrix(sentences, snippets)
+    
+    assert len(matrix) == len(sentences)
+    for sentence, row in zip(sentences, matrix):
+        expected = [analyzer.calculate_similarity(sentence, snippet) for snippet in snippets]
+        assert row == pytest.approx(expected, abs=1e-9)
+
+@pytest.mark.parametrize('engine', ['difflib', 'lcs', 'token_lcs'])
+def test_pruned_best_match_matches_exhaustive(engine):
+    rng = random.Random(11)
+    sentences, snippets = scoring_corpus(sentences=60, snippets=120, seed=11)
+    pruned, pairwise = TextAnalyzer(), TextAnalyzer()
+    pruned.scoring_mode, pairwise.scoring_mode = 'pruned', 'pairwise'
+    pruned.sequence_engine = pairwise.sequence_engine = engine
+    
+    for sentence in sentences:
+        candidates = rng.sample(snippets, 30)
+        assert pruned.best_match(sentence, candidates) == pairwise.best_match(sentence, candidates)
+
+@pytest.mark.parametrize('threshold', [0, 1 << 30])
+def test_scoring_pool_matches_pruned_scoring(threshold):
+    from scoring_pool import ScoringPool
+    
+    rng = random.Random(5)
+    sentences, snippets = scoring_corpus(sentences=30, snippets=60, seed=5)
+    candidates = [rng.sample(snippets, 20) for _ in sentences]
+    analyzer = TextAnalyzer()
+    pool = ScoringPool(workers=2, chunk_size=7, shared_memory_threshold=threshold)
+    
+    try:
+        matches = pool.best_matches(sentences, candidates, analyzer.sequence_engine, analyzer.weights,
+                                    analyzer.get_features)
+    finally:
+        pool.close()
+    
+    assert matches == [analyzer.best_match(s, c) for s, c in zip(sentences, candidates)]
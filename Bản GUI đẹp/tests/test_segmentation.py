@@ -0,0 +1,54 @@
+import re
+import random
+import pytest
+from analyzer import TextAnalyzer
+from benchmark import generate_corpus
+from config import MIN_SENTENCE_WORDS, MAX_SENTENCE_WORDS
+
+LEGACY_PATTERNS = [r'[.!?]+\s+(?=[A-Z])', r'[.!?]+$', r'\n\s*\n', r';\s+(?=[A-Z])']
+
+FRAGMENTS = list("abcdeFGHIJ .!?;;:,\n\n\t'\"-()") + [
+    '. ', '; ', '! ', '... ', ' . ', '.; ', 'The quick brown fox jumps over lazy dogs ', 'Another '
+]
+
+EDGE_CASES = [
+    "word. . Next sentence here about science and research things okay.",
+    "First clause about research methods and data quality; Second clause describing model training results.",
+    "Ends with semicolon; ",
+    "Hello world this is a test sentence with punctuation!?! Another one follows here with many words.",
+    "a.; B c d",
+    "  Leading   whitespace   before a sentence that talks about research quality.\n\nNew paragraph here "
+    "describing several experimental results in detail.  "
+]
+
+def legacy_extract_sentences(analyzer, text):
+    sentences = [analyzer._clean_text(text)]
+    for pattern in LEGACY_PATTERNS:
+        sentences = [part.strip() for sentence in sentences for part in re.split(pattern, sentence) if part.strip()]
+    
+    kept = []
+    for sentence in sentences:
+        words = analyzer._extract_words(sentence)
+        if MIN_SENTENCE_WORDS <= len(words) <= MAX_SENTENCE_WORDS and analyzer._is_meaningful_sentence(sentence, words):
+            kept.append(sentence.strip())
+    return kept
+
+def regression_corpus(cases=3000, seed=5):
+    rng = random.Random(seed)
+    texts = list(EDGE_CASES)
+    texts.append(generate_corpus(300, seed=3)[0])
+    for _ in range(cases):
+        texts.append(''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(10, 400))))
+    return texts
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return TextAnalyzer()
+
+def test_single_pass_segmenter_matches_legacy_multi_pass_split(analyzer):
+    mismatches = [
+        text for text in regression_corpus()
+        if analyzer.extract_sentences(text) != legacy_extract_sentences(analyzer, text)
+    ]
+    
+    assert not mismatches, f"{len(mismatches)} texts segmented differently, first: {mismatches[0]!r}"